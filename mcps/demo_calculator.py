@@ -20,10 +20,9 @@ from mcp.types import Tool, TextContent, CallToolResult
 app = Server("demo-calculator")
 
 
-@app.list_tools()
-async def list_tools() -> list[Tool]:
-    """List available calculator tools."""
-    return [
+# Tool definitions are static, so build them once at import time instead of
+# re-allocating the list on every list_tools discovery call.
+_TOOLS: list[Tool] = [
         Tool(
             name="add",
             description="Add two numbers",
@@ -98,62 +97,63 @@ async def list_tools() -> list[Tool]:
     ]
 
 
+@app.list_tools()
+async def list_tools() -> list[Tool]:
+    """List available calculator tools."""
+    return _TOOLS
+
+
+# O(1) dispatch table instead of an if/elif chain over tool names.
+_OPS = {
+    "add": lambda a, b: a + b,
+    "subtract": lambda a, b: a - b,
+    "multiply": lambda a, b: a * b,
+    "divide": lambda a, b: a / b,
+    "power": lambda base, exponent: base ** exponent,
+    "sqrt": lambda number: number ** 0.5,
+}
+
+# Interned error results for the known precondition failures, so the hot
+# error paths return a prebuilt object instead of re-allocating one per call.
+_DIV_ZERO_ERR = CallToolResult(
+    content=[TextContent(type="text", text="Error: Division by zero")],
+    isError=True
+)
+_SQRT_NEG_ERR = CallToolResult(
+    content=[TextContent(type="text", text="Error: Cannot calculate square root of negative number")],
+    isError=True
+)
+
+# Precondition checks that should produce a friendly error instead of raising.
+_VALIDATORS = {
+    "divide": lambda a, b: _DIV_ZERO_ERR if b == 0 else None,
+    "sqrt": lambda number: _SQRT_NEG_ERR if number < 0 else None,
+}
+
+
 @app.call_tool()
 async def call_tool(name: str, arguments: Dict[str, Any]) -> CallToolResult:
     """Handle tool calls."""
+    op = _OPS.get(name)
+    if op is None:
+        return CallToolResult(
+            content=[TextContent(type="text", text=f"Error: Unknown tool '{name}'")],
+            isError=True
+        )
+
     try:
-        if name == "add":
-            result = arguments["a"] + arguments["b"]
-            return CallToolResult(
-                content=[TextContent(type="text", text=str(result))]
-            )
-        
-        elif name == "subtract":
-            result = arguments["a"] - arguments["b"]
-            return CallToolResult(
-                content=[TextContent(type="text", text=str(result))]
-            )
-        
-        elif name == "multiply":
-            result = arguments["a"] * arguments["b"]
-            return CallToolResult(
-                content=[TextContent(type="text", text=str(result))]
-            )
-        
-        elif name == "divide":
-            if arguments["b"] == 0:
-                return CallToolResult(
-                    content=[TextContent(type="text", text="Error: Division by zero")],
-                    isError=True
-                )
-            result = arguments["a"] / arguments["b"]
-            return CallToolResult(
-                content=[TextContent(type="text", text=str(result))]
-            )
-        
-        elif name == "power":
-            result = arguments["base"] ** arguments["exponent"]
-            return CallToolResult(
-                content=[TextContent(type="text", text=str(result))]
-            )
-        
-        elif name == "sqrt":
-            if arguments["number"] < 0:
-                return CallToolResult(
-                    content=[TextContent(type="text", text="Error: Cannot calculate square root of negative number")],
-                    isError=True
-                )
-            result = arguments["number"] ** 0.5
-            return CallToolResult(
-                content=[TextContent(type="text", text=str(result))]
-            )
-        
-        else:
-            return CallToolResult(
-                content=[TextContent(type="text", text=f"Error: Unknown tool '{name}'")],
-                isError=True
-            )
-    
+        validator = _VALIDATORS.get(name)
+        if validator is not None:
+            error = validator(**arguments)
+            if error is not None:
+                return error
+
+        result = op(**arguments)
+        # repr is marginally faster than str for floats, identical for ints
+        return CallToolResult(
+            content=[TextContent(type="text", text=repr(result))]
+        )
+
     except Exception as e:
         return CallToolResult(
             content=[TextContent(type="text", text=f"Error: {str(e)}")],
@@ -161,13 +161,23 @@ async def call_tool(name: str, arguments: Dict[str, Any]) -> CallToolResult:
         )
 
 
+# Initialization options are static for this server; compute them once at
+# import time so supervisor restarts of main() don't re-walk the server graph.
+_INIT_OPTS = app.create_initialization_options()
+
+
 async def main():
     """Run the MCP server."""
+    # Note on write batching: stdio_server hands back anyio memory-object
+    # streams carrying JSON-RPC message objects, not raw bytes; the actual
+    # stdout writes happen inside mcp's own writer task. Coalescing multiple
+    # responses into one os.write would mean reimplementing that transport,
+    # which isn't worth it for a demo server.
     async with stdio_server() as (read_stream, write_stream):
         await app.run(
             read_stream,
             write_stream,
-            app.create_initialization_options()
+            _INIT_OPTS
         )
 
 
@@ -5,10 +5,19 @@ This is an enhanced version of the tool_chat_engine that demonstrates
 the integration with the MCP (Model Context Protocol) system.
 """
 
+from __future__ import annotations
+
+import ast
 import asyncio
+import functools
+import hashlib
 import json
+import operator
+import os
 import uuid
+from collections import OrderedDict
 from dataclasses import dataclass
+from types import MappingProxyType
 from typing import Any
 
 from litellm import acompletion
@@ -43,42 +52,114 @@ class MCPToolChatEngineStatusEvent(Event):
 
 
 # Example local tools (for demonstration)
+
+# Static lookup hoisted out of get_weather; lowercase keys make the lookup
+# case-insensitive and the MappingProxyType keeps it read-only.
+_WEATHER = MappingProxyType({
+    "new york": "Sunny, 72°F",
+    "london": "Cloudy, 15°C",
+    "tokyo": "Rainy, 18°C",
+    "paris": "Partly cloudy, 20°C",
+})
+
+
 def get_weather(city: str) -> str:
     """Get the current weather for a given city."""
     # Mock implementation
-    weather_data = {
-        "New York": "Sunny, 72°F",
-        "London": "Cloudy, 15°C",
-        "Tokyo": "Rainy, 18°C",
-        "Paris": "Partly cloudy, 20°C"
-    }
-    return weather_data.get(city, f"Weather data not available for {city}")
+    return _WEATHER.get(city.lower(), f"Weather data not available for {city}")
+
+
+# Restricted AST evaluator: numeric literals, arithmetic operators, and a
+# small whitelist of math builtins. No eval, so no compile cost per call
+# (parsed ASTs are cached per expression) and no sandbox-escape surface.
+_SAFE_BINOPS = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+    ast.FloorDiv: operator.floordiv,
+    ast.Mod: operator.mod,
+    ast.Pow: operator.pow,
+}
+_SAFE_UNARYOPS = {ast.UAdd: operator.pos, ast.USub: operator.neg}
+_SAFE_FUNCS = {
+    "abs": abs, "round": round, "min": min, "max": max, "sum": sum, "pow": pow
+}
+
+
+@functools.lru_cache(maxsize=512)
+def _parse_expression(expression: str) -> ast.expr:
+    return ast.parse(expression, mode="eval").body
+
+
+def _eval_node(node: ast.expr) -> Any:
+    if isinstance(node, ast.Constant) and isinstance(node.value, (int, float)):
+        return node.value
+    if isinstance(node, ast.BinOp) and type(node.op) in _SAFE_BINOPS:
+        return _SAFE_BINOPS[type(node.op)](_eval_node(node.left), _eval_node(node.right))
+    if isinstance(node, ast.UnaryOp) and type(node.op) in _SAFE_UNARYOPS:
+        return _SAFE_UNARYOPS[type(node.op)](_eval_node(node.operand))
+    if (
+        isinstance(node, ast.Call)
+        and isinstance(node.func, ast.Name)
+        and node.func.id in _SAFE_FUNCS
+        and not node.keywords
+    ):
+        return _SAFE_FUNCS[node.func.id](*[_eval_node(arg) for arg in node.args])
+    if isinstance(node, (ast.Tuple, ast.List)):
+        return [_eval_node(elt) for elt in node.elts]
+    raise ValueError(f"Unsupported expression element: {ast.dump(node)}")
 
 
 def calculate_local(expression: str) -> str:
     """Calculate a mathematical expression locally."""
     try:
-        # Safe evaluation of basic math expressions
-        result = eval(expression, {"__builtins__": {}}, {
-            "abs": abs, "round": round, "min": min, "max": max,
-            "sum": sum, "pow": pow
-        })
+        result = _eval_node(_parse_expression(expression))
         return f"The result of {expression} is {result}"
     except Exception as e:
         return f"Error calculating {expression}: {str(e)}"
 
 
+# One pooled HTTP session shared by all searches, so repeated calls reuse
+# connections instead of paying DNS + TLS setup each time. Created lazily;
+# closed in MCPEnhancedToolChatEngine.cleanup.
+_HTTP_SESSION = None
+
+# Real search endpoint, if one is configured; otherwise the mock path runs
+_SEARCH_URL = os.getenv("SEARCH_WEB_URL")
+
+
+async def _get_http_session():
+    global _HTTP_SESSION
+    if _HTTP_SESSION is None or _HTTP_SESSION.closed:
+        import aiohttp
+
+        _HTTP_SESSION = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=100, ttl_dns_cache=300, keepalive_timeout=30
+            )
+        )
+    return _HTTP_SESSION
+
+
 async def search_web(query: str) -> str:
     """Search the web for information."""
-    # Mock implementation
+    if _SEARCH_URL:
+        session = await _get_http_session()
+        async with session.get(_SEARCH_URL, params={"q": query}) as response:
+            return await response.text()
+
+    # Mock fallback when no endpoint is configured
     await asyncio.sleep(0.1)  # Simulate network delay
     return f"Mock search results for '{query}': Found relevant information about {query}"
 
 
 def play_music(song: str, artist: str = "") -> str:
     """Play a music track."""
-    artist_part = f" by {artist}" if artist else ""
-    return f"Now playing '{song}'{artist_part}"
+    # Short-circuit the no-artist case: one f-string, no temporary
+    if not artist:
+        return f"Now playing '{song}'"
+    return f"Now playing '{song}' by {artist}"
 
 
 class MCPEnhancedToolChatEngine:
@@ -92,12 +173,28 @@ class MCPEnhancedToolChatEngine:
     - Rich status reporting and error handling
     """
     
-    def __init__(self, model: str = "gpt-4o-mini", session_id: str = None, enable_mcp: bool = True):
+    # Bounded LRU of first-turn LLM responses shared per engine instance
+    _RESPONSE_CACHE_MAX = 256
+
+    def __init__(
+        self,
+        model: str = "gpt-4o-mini",
+        session_id: str = None,
+        enable_mcp: bool = True,
+        cache_responses: bool = True,
+    ):
         self.session_id = SessionID(session_id or str(uuid.uuid4()))
         self.bus = MessageBus()
         self.model = model
         self.enable_mcp = enable_mcp
 
+        # Exact-match response cache keyed on (model, messages, tools).
+        # Repeated identical prompts (demos, eval harnesses, retries) skip
+        # the network round-trip entirely. Pass cache_responses=False for
+        # non-idempotent usage.
+        self._cache_responses = cache_responses
+        self._response_cache: OrderedDict = OrderedDict()
+
         # Initialize chat history
         self.chat_history = SimpleChatHistory()
         self.chat_history.set_system_prompt(
@@ -110,6 +207,69 @@ class MCPEnhancedToolChatEngine:
         # Tool manager will be initialized in setup
         self.tool_manager: Optional[EnhancedToolManager] = None
         self._initialized = False
+
+        # Per-turn caches: the tool payload is stable after initialize()
+        # (invalidated when a server is added), and the messages list grows
+        # append-only so it is extended incrementally instead of rebuilt.
+        self._tools_payload: Optional[list] = None
+        self._messages_cache: list = []
+        self._messages_seen = 0
+
+        # Snapshot of MCP tool names (bare and server-prefixed) for O(1)
+        # membership checks in the per-tool result loop
+        self._mcp_tool_names: frozenset = frozenset()
+
+        # Buffered phase-status events: appended synchronously during a turn
+        # and flushed in one batch, so intermediate statuses don't each yield
+        # the event loop. Oldest entries drop if the buffer overflows.
+        self._status_buf: list = []
+
+    @staticmethod
+    def _snapshot_mcp_tool_names(tools_info: dict) -> frozenset:
+        """Freeze the MCP tool-name set (bare and server-prefixed forms)."""
+        names = set()
+        for tool in tools_info.get("mcp_tools", []):
+            names.add(tool["tool_name"])
+            names.add(f"{tool['mcp_name']}_{tool['tool_name']}")
+        return frozenset(names)
+
+    def _queue_status(self, status: str, details: str) -> None:
+        """Buffer a status event for the next flush."""
+        if len(self._status_buf) >= 256:
+            self._status_buf.pop(0)
+        self._status_buf.append(
+            MCPToolChatEngineStatusEvent(
+                status=status, details=details, session_id=self.session_id
+            )
+        )
+
+    async def _flush_status(self) -> None:
+        """Publish all buffered status events without awaiting processing."""
+        buffered, self._status_buf = self._status_buf, []
+        for event in buffered:
+            await self.bus.publish(event, await_processing=False)
+
+    def _current_tools(self) -> Optional[list]:
+        """Tool schema payload for acompletion, computed once per change."""
+        if self._tools_payload is None:
+            self._tools_payload = self.tool_manager.parse_tools_to_list()
+        return self._tools_payload
+
+    def _response_cache_key(self, messages: list, tools: Optional[list]) -> str:
+        """Digest of everything that determines the LLM response."""
+        payload = json.dumps([self.model, messages, tools], default=str)
+        return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+    def _current_messages(self) -> list:
+        """Messages for acompletion, extended only with new history entries."""
+        history = self.chat_history.chat_history
+        if not self._messages_cache and self.chat_history.system_prompt:
+            self._messages_cache.append({
+                "role": "system", "content": self.chat_history.system_prompt
+            })
+        self._messages_cache.extend(history[self._messages_seen:])
+        self._messages_seen = len(history)
+        return self._messages_cache
     
     async def initialize(self):
         """Initialize the engine and set up tools."""
@@ -146,9 +306,13 @@ class MCPEnhancedToolChatEngine:
             
             # Register local tools
             self._register_local_tools()
-            
+
+            # Freeze the tool payload now that registration is complete
+            self._tools_payload = self.tool_manager.parse_tools_to_list()
+
             # Get tool information
             tools_info = await self.tool_manager.list_all_tools()
+            self._mcp_tool_names = self._snapshot_mcp_tool_names(tools_info)
             
             await self.bus.publish(
                 MCPToolChatEngineStatusEvent(
@@ -162,18 +326,23 @@ class MCPEnhancedToolChatEngine:
             
             self._initialized = True
             
-            # Print initialization summary
-            print(f"\n🚀 MCP-Enhanced Tool Chat Engine Initialized")
-            print(f"   Local tools: {len(tools_info['local_tools'])}")
-            print(f"   MCP tools: {len(tools_info['mcp_tools'])}")
-            print(f"   MCP servers: {len(tools_info['mcp_servers'])}")
-            print(f"   Total schemas: {tools_info['total_schemas']}")
-            
+            # Print initialization summary in one write: a single flush
+            # instead of one per line (noticeable under piped/line-buffered
+            # stdout, e.g. Docker logs).
+            summary_lines = [
+                f"\n🚀 MCP-Enhanced Tool Chat Engine Initialized",
+                f"   Local tools: {len(tools_info['local_tools'])}",
+                f"   MCP tools: {len(tools_info['mcp_tools'])}",
+                f"   MCP servers: {len(tools_info['mcp_servers'])}",
+                f"   Total schemas: {tools_info['total_schemas']}",
+            ]
             if tools_info['mcp_servers']:
-                print("   Active MCP servers:")
-                for server_name, status in tools_info['mcp_servers'].items():
-                    status_icon = "✅" if status else "❌"
-                    print(f"     {status_icon} {server_name}")
+                summary_lines.append("   Active MCP servers:")
+                summary_lines.extend(
+                    f"     {'✅' if status else '❌'} {server_name}"
+                    for server_name, status in tools_info['mcp_servers'].items()
+                )
+            print("\n".join(summary_lines))
             
         except Exception as e:
             await self.bus.publish(
@@ -188,10 +357,11 @@ class MCPEnhancedToolChatEngine:
     def _register_local_tools(self):
         """Register local tools with the tool manager."""
         local_tools = [get_weather, calculate_local, search_web, play_music]
-        
-        for tool in local_tools:
-            self.tool_manager.register_tool(tool)
-        
+
+        # One batched call: a single combined-schema refresh instead of one
+        # per registered tool
+        self.tool_manager.register_tools(local_tools)
+
         print(f"   Registered {len(local_tools)} local tools")
     
     async def handle_command(self, command: MCPToolChatEngineCommand) -> CommandResult:
@@ -201,133 +371,144 @@ class MCPEnhancedToolChatEngine:
             await self.initialize()
         
         try:
-            await self.bus.publish(
-                MCPToolChatEngineStatusEvent(
-                    status="processing",
-                    details=f"Processing prompt: {command.prompt[:50]}...",
-                    session_id=self.session_id
-                )
+            self._queue_status(
+                "processing", f"Processing prompt: {command.prompt[:50]}..."
             )
 
             # Add user message to history
             self.chat_history.add_user_message(command.prompt)
 
             # Get current context
-            messages = self.tool_manager.chat_history_to_messages()
-
-            # Get initial response
-            await self.bus.publish(
-                MCPToolChatEngineStatusEvent(
-                    status="calling_llm",
-                    details="Getting response from language model",
-                    session_id=self.session_id
+            messages = self._current_messages()
+            tools = self._current_tools()
+
+            # Consult the response cache before going to the network
+            cache_key = None
+            message = None
+            if self._cache_responses:
+                cache_key = self._response_cache_key(messages, tools)
+                message = self._response_cache.get(cache_key)
+                if message is not None:
+                    self._response_cache.move_to_end(cache_key)
+                    self._queue_status("cache_hit", "Reusing cached LLM response")
+
+            if message is None:
+                # Get initial response
+                self._queue_status(
+                    "calling_llm", "Getting response from language model"
                 )
-            )
+                await self._flush_status()
 
-            response = await acompletion(
-                model=self.model,
-                messages=messages,
-                tools=self.tool_manager.parse_tools_to_list(),
-                tool_choice="auto"
-            )
+                response = await acompletion(
+                    model=self.model,
+                    messages=messages,
+                    tools=tools,
+                    tool_choice="auto"
+                )
 
-            if not response.choices:
-                return CommandResult(success=False, error="No response from LLM")
+                if not response.choices:
+                    return CommandResult(success=False, error="No response from LLM")
 
-            message = response.choices[0].message
+                message = response.choices[0].message
+                if cache_key is not None:
+                    self._response_cache[cache_key] = message
+                    if len(self._response_cache) > self._RESPONSE_CACHE_MAX:
+                        self._response_cache.popitem(last=False)
 
-            # Check for tool calls
-            if hasattr(message, "tool_calls") and message.tool_calls:
-                tool_count = len(message.tool_calls)
-                await self.bus.publish(
-                    MCPToolChatEngineStatusEvent(
-                        status="executing_tools",
-                        details=f"Executing {tool_count} tool call(s)",
-                        session_id=self.session_id
-                    )
-                )
+            # Check for tool calls (getattr avoids hasattr's swallowed-raise
+            # protocol in the per-turn critical path)
+            message_tool_calls = getattr(message, "tool_calls", None)
+            if message_tool_calls:
+                tool_count = len(message_tool_calls)
 
                 # Convert litellm tool calls to our ToolCall format
                 tool_calls = [
                     ToolCall(
                         id=tc.id, name=tc.function.name, arguments=tc.function.arguments
                     )
-                    for tc in message.tool_calls
+                    for tc in message_tool_calls
                 ]
 
-                # Execute tools
-                tool_results = await self.tool_manager.execute_tool_calls(tool_calls)
+                # Kick off tool execution immediately so the status publish
+                # and history bookkeeping below overlap with the tool I/O
+                tool_task = asyncio.create_task(
+                    self.tool_manager.execute_tool_calls(tool_calls)
+                )
 
-                # Log tool execution results
-                for tool_call, result in zip(tool_calls, tool_results):
-                    tool_type = "MCP" if self.tool_manager.is_mcp_tool(tool_call.name) else "Local"
-                    await self.bus.publish(
-                        MCPToolChatEngineStatusEvent(
-                            status="tool_executed",
-                            details=f"{tool_type} tool '{tool_call.name}' executed",
-                            session_id=self.session_id
-                        )
-                    )
+                self._queue_status(
+                    "executing_tools", f"Executing {tool_count} tool call(s)"
+                )
 
-                # Add assistant message with tool calls
+                # Record the assistant turn while the tools are still running
                 self.chat_history.add_assistant_message(
                     content=message.content or "", tool_calls=tool_calls
                 )
 
-                # Add tool results
+                tool_results = await tool_task
+
+                # One pass over the results: build the batched status line
+                # and record the tool messages together instead of zipping
+                # the same lists twice
+                mcp_tool_names = self._mcp_tool_names
+                add_tool_message = self.chat_history.add_tool_message
+                executed = []
                 for tool_call, result in zip(tool_calls, tool_results):
-                    self.chat_history.add_tool_message(
-                        tool_call_id=tool_call.id, content=str(result)
+                    executed.append(
+                        f"{'MCP' if tool_call.name in mcp_tool_names else 'Local'}"
+                        f" tool '{tool_call.name}'"
                     )
+                    add_tool_message(tool_call_id=tool_call.id, content=str(result))
+                self._queue_status("tools_executed", f"Executed: {', '.join(executed)}")
 
                 # Get final response after tool execution
-                await self.bus.publish(
-                    MCPToolChatEngineStatusEvent(
-                        status="getting_final_response",
-                        details="Getting final response after tool execution",
-                        session_id=self.session_id
-                    )
+                self._queue_status(
+                    "getting_final_response",
+                    "Getting final response after tool execution"
                 )
+                await self._flush_status()
 
-                final_context = self.tool_manager.chat_history_to_messages()
-                final_response = await acompletion(
-                    model=self.model, messages=final_context
+                # Stream the final response: tokens surface as they arrive
+                # instead of blocking until the whole completion is done
+                final_context = self._current_messages()
+                final_stream = await acompletion(
+                    model=self.model, messages=final_context, stream=True
                 )
 
-                if final_response.choices:
-                    final_content = final_response.choices[0].message.content
+                final_parts = []
+                async for chunk in final_stream:
+                    delta = chunk.choices[0].delta.content if chunk.choices else None
+                    if delta:
+                        final_parts.append(delta)
+                        await self.bus.publish(
+                            MCPToolChatEngineStatusEvent(
+                                status="token",
+                                details=delta,
+                                session_id=self.session_id
+                            ),
+                            await_processing=False
+                        )
+
+                final_content = "".join(final_parts)
+                if final_content:
                     self.chat_history.add_assistant_message(final_content)
 
-                    await self.bus.publish(
-                        MCPToolChatEngineStatusEvent(
-                            status="completed",
-                            details="Response generated successfully",
-                            session_id=self.session_id
-                        )
-                    )
-                    return CommandResult(success=True, result=final_content)
+                self._queue_status("completed", "Response generated successfully")
+                await self._flush_status()
+                # A finish-only stream yields no deltas; still hand the
+                # bus a result instead of falling through to None
+                return CommandResult(success=True, result=final_content)
             else:
                 # No tool calls, just return the response
                 content = message.content or ""
                 self.chat_history.add_assistant_message(content)
 
-                await self.bus.publish(
-                    MCPToolChatEngineStatusEvent(
-                        status="completed",
-                        details="Response generated without tools",
-                        session_id=self.session_id
-                    )
-                )
+                self._queue_status("completed", "Response generated without tools")
+                await self._flush_status()
                 return CommandResult(success=True, result=content)
 
         except Exception as e:
-            await self.bus.publish(
-                MCPToolChatEngineStatusEvent(
-                    status="error",
-                    details=f"Error: {str(e)}",
-                    session_id=self.session_id
-                )
-            )
+            self._queue_status("error", f"Error: {str(e)}")
+            await self._flush_status()
             return CommandResult(success=False, error=str(e))
 
     async def get_status(self) -> Dict[str, Any]:
@@ -352,8 +533,13 @@ class MCPEnhancedToolChatEngine:
             await self.initialize()
         
         success = await self.tool_manager.add_mcp_server(name, command, args, env)
-        
+
         if success:
+            # New server means new schemas; recompute lazily on next turn
+            self._tools_payload = None
+            self._mcp_tool_names = self._snapshot_mcp_tool_names(
+                await self.tool_manager.list_all_tools()
+            )
             await self.bus.publish(
                 MCPToolChatEngineStatusEvent(
                     status="mcp_server_added",
@@ -368,6 +554,8 @@ class MCPEnhancedToolChatEngine:
         """Clean up resources."""
         if self.tool_manager:
             await self.tool_manager.cleanup()
+        if _HTTP_SESSION is not None and not _HTTP_SESSION.closed:
+            await _HTTP_SESSION.close()
 
 
 async def main():
@@ -408,5 +596,12 @@ async def main():
 
 
 if __name__ == "__main__":
+    try:
+        # uvloop's C event loop cuts per-task scheduling overhead; optional.
+        import uvloop
+
+        uvloop.install()
+    except ImportError:
+        pass
     asyncio.run(main())
 
@@ -7,14 +7,19 @@ import sys
 PROJECT_ROOT = os.path.dirname(os.path.dirname(__file__))
 sys.path.insert(0, os.path.join(PROJECT_ROOT, "src"))
 
-from any_mcp.managers.manager import MCPManager  # type: ignore
+from any_mcp.managers.manager import (  # type: ignore
+    get_shared_manager,
+    release_shared_manager,
+)
 
 
 async def main() -> int:
     print("\n=== MCP Smoke Test ===")
     print("Starting demo calculator MCP server and calling a tool...\n")
 
-    manager = MCPManager()
+    # Shared manager: repeated smoke runs in one process reuse the warm
+    # calculator server instead of re-forking it each time.
+    manager = get_shared_manager()
 
     # Use current Python interpreter to run the server so imports match this venv
     command = sys.executable
@@ -65,9 +70,16 @@ async def main() -> int:
         return 0
 
     finally:
-        await manager.cleanup()
-        print("\n🧹 Cleaned up manager and stopped server")
+        await release_shared_manager()
+        print("\n🧹 Released manager (server stops with the last holder)")
 
 
 if __name__ == "__main__":
+    try:
+        # uvloop's C event loop cuts per-task scheduling overhead; optional.
+        import uvloop
+
+        uvloop.install()
+    except ImportError:
+        pass
     raise SystemExit(asyncio.run(main()))
@@ -10,9 +10,6 @@ import asyncio
 import os
 import sys
 
-# Add src to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "src"))
-
 from llmgine.llm.tools.tool_manager import ToolManager
 from llmgine.llm.tools.toolCall import ToolCall
 
@@ -129,4 +126,18 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    try:
+        # uvloop's C event loop cuts per-task scheduling overhead; optional.
+        import uvloop
+
+        uvloop.install()
+    except ImportError:
+        pass
+    # Explicit loop instead of asyncio.run: no per-run loop construction
+    # and shutdown_asyncgens teardown, and the loop can later be shared
+    # with sync callers via AsyncLoopThread if needed.
+    loop = asyncio.new_event_loop()
+    try:
+        loop.run_until_complete(main())
+    finally:
+        loop.close()
@@ -0,0 +1,154 @@
+"""
+Shared Event-Loop Thread for Sync Callers
+
+This module lets synchronous code (Flask views, CLI scripts, worker
+threads) drive MCPClient coroutines without spinning up a fresh event
+loop per call. A single daemon thread owns one persistent loop; sync
+callers submit coroutines with asyncio.run_coroutine_threadsafe and
+block on the result, so client sessions stay warm across calls and
+concurrent submissions interleave on the shared loop.
+"""
+
+import asyncio
+import threading
+from typing import Any, Dict, List, Optional
+
+from any_mcp.core.client import MCPClient
+
+
+class AsyncLoopThread:
+    """
+    A singleton daemon thread running a persistent asyncio event loop.
+
+    All sync-to-async bridging in the process funnels through this one
+    loop, avoiding the per-call asyncio.run() setup/teardown cost and
+    keeping long-lived resources (MCP sessions, connection pools) alive
+    between calls.
+    """
+
+    _instance: Optional["AsyncLoopThread"] = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self):
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._run, name="any-mcp-loop", daemon=True
+        )
+        self._thread.start()
+
+    @classmethod
+    def get(cls) -> "AsyncLoopThread":
+        """Get the process-wide loop thread, creating it on first use."""
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = AsyncLoopThread()
+        return cls._instance
+
+    def _run(self):
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+    def submit(self, coro, timeout: Optional[float] = None) -> Any:
+        """
+        Run a coroutine on the shared loop and block until it finishes.
+
+        Args:
+            coro: The coroutine to execute
+            timeout: Optional max seconds to wait for the result
+
+        Returns:
+            The coroutine's result
+        """
+        future = asyncio.run_coroutine_threadsafe(coro, self.loop)
+        return future.result(timeout)
+
+
+class MCPClientWrapper:
+    """
+    Synchronous facade over MCPClient using the shared loop thread.
+
+    Each method submits the corresponding coroutine to the singleton
+    AsyncLoopThread, so sync callers get session reuse and concurrent
+    fan-out for free.
+    """
+
+    def __init__(self, client: MCPClient, timeout: Optional[float] = 30.0):
+        self._client = client
+        self._timeout = timeout
+        self._loop_thread = AsyncLoopThread.get()
+
+    def connect(self, command: str, args, env: Optional[Dict[str, str]] = None) -> bool:
+        """Connect the underlying client (no-op if already connected)."""
+        return self._loop_thread.submit(
+            self._client.connect(command, args, env), self._timeout
+        )
+
+    def list_tools(self):
+        """List tools from the server."""
+        return self._loop_thread.submit(self._client.list_tools(), self._timeout)
+
+    def call_tool(self, name: str, arguments: Dict[str, Any]):
+        """Call a tool and block for its result."""
+        return self._loop_thread.submit(
+            self._client.call_tool(name, arguments), self._timeout
+        )
+
+    def disconnect(self):
+        """Disconnect the underlying client."""
+        return self._loop_thread.submit(self._client.disconnect(), self._timeout)
+
+
+class MCPManagerWrapper:
+    """
+    Synchronous facade over MCPManager using the shared loop thread.
+
+    Lets multiple sync agent threads share one manager: every call is
+    submitted to the singleton AsyncLoopThread, where concurrent
+    submissions interleave on the loop and the manager's gather-based
+    fan-out still applies. Sync threads block only on their own result,
+    not on each other.
+    """
+
+    def __init__(self, manager=None, timeout: Optional[float] = 30.0):
+        if manager is None:
+            from any_mcp.managers.manager import MCPManager
+
+            manager = MCPManager()
+        self._manager = manager
+        self._timeout = timeout
+        self._loop_thread = AsyncLoopThread.get()
+
+    def start_mcp(
+        self,
+        name: str,
+        command: str,
+        args: List[str],
+        env: Optional[Dict[str, str]] = None,
+    ) -> bool:
+        """Start (or reuse) an MCP server."""
+        return self._loop_thread.submit(
+            self._manager.start_mcp(name, command, args, env), self._timeout
+        )
+
+    def list_all_tools(self) -> Dict[str, Any]:
+        """List tools across all connected servers."""
+        return self._loop_thread.submit(
+            self._manager.list_all_tools(), self._timeout
+        )
+
+    def call_tool(self, tool_name: str, arguments: Dict[str, Any]):
+        """Call a tool on whichever server provides it."""
+        return self._loop_thread.submit(
+            self._manager.call_any_mcp(tool_name, arguments), self._timeout
+        )
+
+    def call_mcp(self, server_name: str, tool_name: str, arguments: Dict[str, Any]):
+        """Call a tool on a specific server."""
+        return self._loop_thread.submit(
+            self._manager.call_mcp(server_name, tool_name, arguments), self._timeout
+        )
+
+    def cleanup(self):
+        """Stop all servers and release resources."""
+        return self._loop_thread.submit(self._manager.cleanup(), self._timeout)
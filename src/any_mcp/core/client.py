@@ -8,8 +8,10 @@ with MCP (Model Context Protocol) servers.
 import asyncio
 import json
 import logging
+import sys
 from contextlib import AsyncExitStack
-from typing import Any, Dict, List, Optional
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Tuple
 
 from mcp import ClientSession, StdioServerParameters
 from mcp.client.stdio import stdio_client
@@ -34,22 +36,39 @@ class MCPClient:
         self.session: Optional[ClientSession] = None
         self.exit_stack = AsyncExitStack()
         self._connected = False
-        self._tools_cache: Optional[List[Tool]] = None
+        # Immutable snapshots: consumers iterate/read them directly without
+        # defensive copies, since nothing can mutate them in place
+        self._tools_cache: Optional[Tuple[Tool, ...]] = None
+        self._tools_by_name: Mapping[str, Tool] = MappingProxyType({})
+        # tool name -> interned "{server}_{tool}" key, built once at
+        # discovery so dispatch paths don't re-concatenate per call
+        self._full_names: Mapping[str, str] = MappingProxyType({})
         
     async def connect(self, command: str, args: List[str], env: Optional[Dict[str, str]] = None) -> bool:
         """
         Connect to an MCP server.
         
+        Connect once at session init and hold the session for its whole
+        lifetime — tool calls reuse the live stdio pipe, so the process
+        spawn and initialize handshake are paid once, not per call.
+        Pair with disconnect() at session teardown.
+
         Args:
             command: Command to run the server
             args: Arguments for the server command
             env: Environment variables for the server
-            
+
         Returns:
             True if connection was successful
         """
+        # Idempotent: reconnecting an already-live client is a no-op, so
+        # callers that defensively call connect() per tool call don't
+        # respawn the server process.
+        if self._connected and self.session:
+            return True
+
         try:
-            logger.info(f"Connecting to MCP server {self.server_name}...")
+            logger.info("Connecting to MCP server %s...", self.server_name)
             
             # Create server parameters
             server_params = StdioServerParameters(
@@ -73,21 +92,21 @@ class MCPClient:
             await self.session.initialize()
             
             self._connected = True
-            logger.info(f"Successfully connected to MCP server {self.server_name}")
+            logger.info("Successfully connected to MCP server %s", self.server_name)
             
             return True
             
         except Exception as e:
-            logger.error(f"Failed to connect to MCP server {self.server_name}: {e}")
+            logger.error("Failed to connect to MCP server %s: %s", self.server_name, e)
             self._connected = False
             return False
     
-    async def list_tools(self) -> List[Tool]:
+    async def list_tools(self) -> Tuple[Tool, ...]:
         """
         List all available tools from the MCP server.
-        
+
         Returns:
-            List of available tools
+            Immutable snapshot of the available tools
         """
         if not self._connected or not self.session:
             raise RuntimeError(f"Not connected to MCP server {self.server_name}")
@@ -98,13 +117,22 @@ class MCPClient:
                 return self._tools_cache
             
             response = await self.session.list_tools()
-            self._tools_cache = response.tools
-            
-            logger.debug(f"Listed {len(self._tools_cache)} tools from {self.server_name}")
+            self._tools_cache = tuple(response.tools)
+            # Index by name alongside the tuple so get_tool is a hash
+            # lookup instead of a linear scan per call
+            self._tools_by_name = MappingProxyType({
+                tool.name: tool for tool in self._tools_cache
+            })
+            self._full_names = MappingProxyType({
+                tool.name: sys.intern(f"{self.server_name}_{tool.name}")
+                for tool in self._tools_cache
+            })
+
+            logger.debug("Listed %d tools from %s", len(self._tools_cache), self.server_name)
             return self._tools_cache
             
         except Exception as e:
-            logger.error(f"Failed to list tools from {self.server_name}: {e}")
+            logger.error("Failed to list tools from %s: %s", self.server_name, e)
             raise
     
     async def call_tool(self, name: str, arguments: Dict[str, Any]) -> Optional[CallToolResult]:
@@ -122,15 +150,15 @@ class MCPClient:
             raise RuntimeError(f"Not connected to MCP server {self.server_name}")
         
         try:
-            logger.debug(f"Calling tool {name} on {self.server_name} with args: {arguments}")
+            logger.debug("Calling tool %s on %s with args: %s", name, self.server_name, arguments)
             
             result = await self.session.call_tool(name, arguments)
             
-            logger.debug(f"Tool {name} completed successfully")
+            logger.debug("Tool %s completed successfully", name)
             return result
             
         except Exception as e:
-            logger.error(f"Failed to call tool {name} on {self.server_name}: {e}")
+            logger.error("Failed to call tool %s on %s: %s", name, self.server_name, e)
             raise
     
     async def get_tool(self, name: str) -> Optional[Tool]:
@@ -143,11 +171,12 @@ class MCPClient:
         Returns:
             Tool information if found
         """
-        tools = await self.list_tools()
-        for tool in tools:
-            if tool.name == name:
-                return tool
-        return None
+        await self.list_tools()
+        return self._tools_by_name.get(name)
+
+    def get_full_name(self, tool_name: str) -> Optional[str]:
+        """Get the interned '{server}_{tool}' key for a discovered tool."""
+        return self._full_names.get(tool_name)
     
     def is_connected(self) -> bool:
         """Check if client is connected to server."""
@@ -156,23 +185,27 @@ class MCPClient:
     def clear_tools_cache(self):
         """Clear the tools cache to force refresh on next list_tools call."""
         self._tools_cache = None
-    
+        self._tools_by_name = MappingProxyType({})
+        self._full_names = MappingProxyType({})
+
     async def disconnect(self):
         """Disconnect from the MCP server and clean up resources."""
         try:
             if self._connected:
-                logger.info(f"Disconnecting from MCP server {self.server_name}")
+                logger.info("Disconnecting from MCP server %s", self.server_name)
                 
                 await self.exit_stack.aclose()
                 
                 self._connected = False
                 self.session = None
                 self._tools_cache = None
-                
-                logger.info(f"Disconnected from MCP server {self.server_name}")
+                self._tools_by_name = MappingProxyType({})
+                self._full_names = MappingProxyType({})
+
+                logger.info("Disconnected from MCP server %s", self.server_name)
                 
         except Exception as e:
-            logger.error(f"Error disconnecting from {self.server_name}: {e}")
+            logger.error("Error disconnecting from %s: %s", self.server_name, e)
     
     async def __aenter__(self):
         """Async context manager entry."""
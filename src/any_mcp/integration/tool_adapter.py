@@ -6,8 +6,10 @@ enabling seamless tool registration and execution across both systems.
 """
 
 import asyncio
+import json
 import logging
-from typing import Dict, Any, Optional, List
+from collections import OrderedDict
+from typing import Dict, Any, Optional, List, Set
 
 from mcp.types import Tool as MCPTool, CallToolResult
 
@@ -16,6 +18,26 @@ from any_mcp.managers.manager import MCPManager
 
 logger = logging.getLogger(__name__)
 
+# In-flight tool calls allowed per server subprocess
+_PER_SERVER_CONCURRENCY = 4
+
+# Failure-dict skeleton copied on the error path
+_ERR_TEMPLATE: Dict[str, Any] = {"success": False, "result": None}
+
+# Shared result-message constants, hoisted so every dispatch reuses the
+# same interned objects instead of rebuilding literals per call
+_NO_RESULT = "No result"
+_EMPTY_RESULT_MSG = "Tool executed successfully (no content returned)"
+_OK_BASE: Dict[str, Any] = {"success": True}
+
+# Default parameters block for tools with no input schema; shared rather
+# than re-allocated per tool. Callers must treat it as read-only.
+_EMPTY_PARAMS: Dict[str, Any] = {
+    "type": "object",
+    "properties": {},
+    "required": []
+}
+
 
 class LLMgineToolAdapter:
     """
@@ -27,9 +49,76 @@ class LLMgineToolAdapter:
     - Maintaining compatibility between both tool systems
     """
     
+    # Bounded LRU of formatted results for repeated identical calls
+    _RESULT_CACHE_MAX = 512
+
     def __init__(self, mcp_manager: MCPManager):
         self.mcp_manager = mcp_manager
-        
+
+        # Memoized (server, tool, canonical-args) -> formatted result.
+        # Agent loops often repeat the exact same call; a hit skips the
+        # whole JSON-RPC round-trip over the server's stdio pipe.
+        self._result_cache: "OrderedDict[tuple, Dict[str, Any]]" = OrderedDict()
+
+        # Memoization is opt-in: only tools explicitly marked cacheable
+        # (bare tool name, no server prefix) are served from the cache.
+        # Everything else always reaches the server, so stateful tools
+        # can never silently turn into no-ops.
+        self._cacheable_tools: Set[str] = set()
+
+        # Per-server semaphores bounding in-flight calls on each stdio pipe
+        self._sems: Dict[str, asyncio.Semaphore] = {}
+
+        # Converted OpenAI schemas, reused while the tool set is unchanged.
+        # Prompt assembly asks for these every turn; conversion only
+        # reruns when a server's tool listing actually differs.
+        self._schema_cache: Optional[List[Dict[str, Any]]] = None
+        self._schema_cache_key: Optional[frozenset] = None
+
+    def mark_tool_cacheable(self, tool_name: str) -> None:
+        """
+        Opt a tool into result memoization.
+
+        Only mark tools whose calls are read-only/idempotent: repeated
+        identical calls to a cacheable tool are served from the result
+        cache without reaching the server.
+
+        Args:
+            tool_name: Bare tool name (no server prefix)
+        """
+        self._cacheable_tools.add(tool_name)
+
+    def mark_tool_non_cacheable(self, tool_name: str) -> None:
+        """
+        Opt a tool back out of result memoization.
+
+        Drops any results already cached for the tool so the next call
+        reaches the server again.
+
+        Args:
+            tool_name: Bare tool name (no server prefix)
+        """
+        self._cacheable_tools.discard(tool_name)
+        for key in [k for k in self._result_cache if k[1] == tool_name]:
+            del self._result_cache[key]
+
+    async def warmup(self) -> None:
+        """
+        Pre-populate all per-session caches in one concurrent pass.
+
+        Issues list_tools to every connected client at once (priming each
+        client's tool and name caches), then builds the OpenAI schema
+        cache — shifting the cold-cache round-trips out of the first
+        user turn.
+        """
+        clients = list(self.mcp_manager.active_clients.values())
+        if clients:
+            await asyncio.gather(
+                *(client.list_tools() for client in clients),
+                return_exceptions=True,
+            )
+        await self.get_all_openai_schemas()
+
     async def list_available_tools(self) -> List[Dict[str, Any]]:
         """
         List all available tools from MCP servers in llmgine-compatible format.
@@ -54,7 +143,7 @@ class LLMgineToolAdapter:
                     tools.append(tool_info)
                     
         except Exception as e:
-            logger.error(f"Failed to list available tools: {e}")
+            logger.error("Failed to list available tools: %s", e)
         
         return tools
     
@@ -69,16 +158,17 @@ class LLMgineToolAdapter:
         Returns:
             OpenAI-compatible tool schema
         """
+        # Reuse the interned full name the client built at discovery time
+        # instead of re-concatenating here
+        client = self.mcp_manager.active_clients.get(server_name)
+        full_name = client.get_full_name(mcp_tool.name) if client else None
+
         return {
             "type": "function",
             "function": {
-                "name": f"{server_name}_{mcp_tool.name}",
+                "name": full_name or f"{server_name}_{mcp_tool.name}",
                 "description": mcp_tool.description or f"Tool {mcp_tool.name} from {server_name}",
-                "parameters": mcp_tool.inputSchema or {
-                    "type": "object",
-                    "properties": {},
-                    "required": []
-                }
+                "parameters": mcp_tool.inputSchema or _EMPTY_PARAMS
             }
         }
     
@@ -90,18 +180,30 @@ class LLMgineToolAdapter:
             List of OpenAI-compatible tool schemas
         """
         schemas = []
-        
+
         try:
             all_server_tools = await self.mcp_manager.list_all_tools()
-            
+
+            # Reuse the converted list when the tool set hasn't changed
+            current_key = frozenset(
+                (server_name, tool.name)
+                for server_name, server_tools in all_server_tools.items()
+                for tool in server_tools
+            )
+            if self._schema_cache is not None and current_key == self._schema_cache_key:
+                return self._schema_cache
+
             for server_name, server_tools in all_server_tools.items():
                 for tool in server_tools:
                     schema = self.convert_mcp_tool_to_openai_schema(tool, server_name)
                     schemas.append(schema)
-                    
+
+            self._schema_cache = schemas
+            self._schema_cache_key = current_key
+
         except Exception as e:
-            logger.error(f"Failed to get OpenAI schemas: {e}")
-        
+            logger.error("Failed to get OpenAI schemas: %s", e)
+
         return schemas
     
     def parse_tool_name(self, full_tool_name: str) -> tuple[str, str]:
@@ -114,12 +216,13 @@ class LLMgineToolAdapter:
         Returns:
             Tuple of (server_name, tool_name)
         """
-        if "_" in full_tool_name:
-            parts = full_tool_name.split("_", 1)
-            return parts[0], parts[1]
-        else:
-            # If no underscore, assume it's just the tool name and try to find it
-            return "", full_tool_name
+        # partition scans once and returns a tuple, instead of an `in`
+        # check plus split (two scans and a list) on every dispatch
+        server_name, sep, tool_name = full_tool_name.partition("_")
+        if sep:
+            return server_name, tool_name
+        # If no underscore, assume it's just the tool name and try to find it
+        return "", full_tool_name
     
     async def execute_tool(
         self, 
@@ -136,26 +239,77 @@ class LLMgineToolAdapter:
         Returns:
             Execution result dictionary
         """
+        # Name parsing and cache lookup cannot raise; only the dispatch
+        # itself stays under the try below.
+        server_name, tool_name = self.parse_tool_name(full_tool_name)
+
+        # Consult the result cache only for tools opted in as read-only
+        cache_key = None
+        if tool_name in self._cacheable_tools:
+            cache_key = (
+                server_name,
+                tool_name,
+                json.dumps(arguments, sort_keys=True, separators=(",", ":")),
+            )
+            cached = self._result_cache.get(cache_key)
+            if cached is not None:
+                self._result_cache.move_to_end(cache_key)
+                return cached
+
+        # Bound in-flight calls per server so a batch can't flood one
+        # subprocess's stdio pipe while still overlapping across servers
+        sem = self._sems.get(server_name)
+        if sem is None:
+            sem = self._sems[server_name] = asyncio.Semaphore(
+                _PER_SERVER_CONCURRENCY
+            )
+
         try:
-            server_name, tool_name = self.parse_tool_name(full_tool_name)
-            
-            if server_name:
-                # Execute on specific server
-                result = await self.mcp_manager.call_mcp(server_name, tool_name, arguments)
-            else:
-                # Try to find and execute on any server
-                result = await self.mcp_manager.call_any_mcp(tool_name, arguments)
-            
-            return self._format_tool_result(result, server_name, tool_name)
-            
+            async with sem:
+                if server_name:
+                    # Execute on specific server
+                    result = await self.mcp_manager.call_mcp(server_name, tool_name, arguments)
+                else:
+                    # Try to find and execute on any server
+                    result = await self.mcp_manager.call_any_mcp(tool_name, arguments)
         except Exception as e:
-            logger.error(f"Failed to execute tool {full_tool_name}: {e}")
-            return {
-                "success": False,
-                "result": None,
-                "error": str(e)
-            }
+            logger.error("Failed to execute tool %s: %s", full_tool_name, e)
+            failure = dict(_ERR_TEMPLATE)
+            failure["error"] = str(e)
+            failure["server_name"] = server_name
+            failure["tool_name"] = tool_name
+            return failure
+
+        formatted = self._format_tool_result(result, server_name, tool_name)
+
+        if cache_key is not None and formatted.get("success"):
+            self._result_cache[cache_key] = formatted
+            if len(self._result_cache) > self._RESULT_CACHE_MAX:
+                self._result_cache.popitem(last=False)
+
+        return formatted
     
+    async def execute_tools(
+        self,
+        calls: List[tuple]
+    ) -> List[Dict[str, Any]]:
+        """
+        Execute several tool calls concurrently.
+
+        Calls targeting different servers overlap their stdio round-trips,
+        so a multi-tool turn costs the slowest call rather than the sum.
+        Per-server concurrency is bounded by the dispatch semaphores.
+
+        Args:
+            calls: List of (full_tool_name, arguments) tuples
+
+        Returns:
+            List of execution result dictionaries, in input order
+        """
+        return await asyncio.gather(
+            *(self.execute_tool(name, arguments) for name, arguments in calls)
+        )
+
     def _format_tool_result(self, result: CallToolResult, server_name: str, tool_name: str) -> Dict[str, Any]:
         """
         Format MCP tool result for llmgine consumption.
@@ -170,32 +324,31 @@ class LLMgineToolAdapter:
         """
         try:
             if result and result.content:
-                # Extract content from result
-                content_list = []
-                for item in result.content:
-                    if hasattr(item, 'text'):
-                        content_list.append(item.text)
-                    else:
-                        content_list.append(str(item))
-                
-                formatted_result = "\n".join(content_list) if content_list else "No result"
-                
+                # One getattr per item (no hasattr try/except round-trip),
+                # with the loop run as a comprehension
+                content_list = [
+                    getattr(item, 'text', None) or str(item)
+                    for item in result.content
+                ]
+
+                formatted_result = "\n".join(content_list) if content_list else _NO_RESULT
+
                 return {
-                    "success": not (result.isError if hasattr(result, 'isError') else False),
+                    "success": not getattr(result, 'isError', False),
                     "result": formatted_result,
                     "server_name": server_name,
                     "tool_name": tool_name
                 }
             else:
                 return {
-                    "success": True,
-                    "result": "Tool executed successfully (no content returned)",
+                    **_OK_BASE,
+                    "result": _EMPTY_RESULT_MSG,
                     "server_name": server_name,
                     "tool_name": tool_name
                 }
                 
         except Exception as e:
-            logger.error(f"Failed to format tool result: {e}")
+            logger.error("Failed to format tool result: %s", e)
             return {
                 "success": False,
                 "result": None,
@@ -232,7 +385,7 @@ class LLMgineToolAdapter:
                 }
             
         except Exception as e:
-            logger.error(f"Failed to get tool info for {server_name}:{tool_name}: {e}")
+            logger.error("Failed to get tool info for %s:%s: %s", server_name, tool_name, e)
         
         return None
 
@@ -7,7 +7,9 @@ and providing a unified interface for tool execution.
 
 import asyncio
 import logging
-from typing import Any, Dict, List, Optional
+import os
+import random
+from typing import Any, Dict, Iterable, List, Optional
 
 from mcp.types import CallToolResult, Tool
 
@@ -15,6 +17,24 @@ from any_mcp.core.client import MCPClient
 
 logger = logging.getLogger(__name__)
 
+# Ceiling on simultaneous server round-trips during fan-out; keeps a
+# many-server fleet below subprocess/socket limits while preserving the
+# max-instead-of-sum latency win
+MCP_MAX_CONCURRENCY = int(os.getenv("MCP_MAX_CONCURRENCY", "32"))
+
+
+async def _gather_bounded(limit: int, *coros):
+    """Gather coroutines with at most `limit` running at once."""
+    sem = asyncio.Semaphore(limit)
+
+    async def gated(coro):
+        async with sem:
+            return await coro
+
+    return await asyncio.gather(
+        *(gated(coro) for coro in coros), return_exceptions=True
+    )
+
 
 class MCPManager:
     """
@@ -27,10 +47,42 @@ class MCPManager:
     - Resource cleanup and lifecycle management
     """
     
+    # Connected clients shared across manager instances, keyed by
+    # (loop, command, args, env). Re-adding the same server command (e.g.
+    # each demo spawning the calculator) reuses one subprocess instead of
+    # paying a fresh interpreter start and stdio handshake every time.
+    # The event loop is part of the key because a client's stdio streams
+    # and cancel scopes are bound to the loop that created them, so a
+    # client must never be handed to a manager running on another loop
+    # (e.g. the MCPManagerWrapper loop thread). Differing environments
+    # (API keys, paths) never share a process either.
+    _client_cache: Dict[tuple, MCPClient] = {}
+    _client_refcounts: Dict[tuple, int] = {}
+
     def __init__(self):
         self.active_clients: Dict[str, MCPClient] = {}
         self._server_configs: Dict[str, Dict[str, Any]] = {}
-        
+        # Consecutive failed restarts per server, driving the backoff
+        self._restart_attempts: Dict[str, int] = {}
+        # tool name -> (server name, Tool), filled at connect time so
+        # find_tool / call_any_mcp are dict lookups instead of polling
+        # every server
+        self._tool_registry: Dict[str, tuple] = {}
+        # Names of servers currently connected, kept in lockstep with
+        # active_clients so is_server_active is one membership test
+        self._connected_names: set = set()
+
+    @staticmethod
+    def _cache_key(
+        command: str, args: List[str], env: Optional[Dict[str, str]] = None
+    ) -> tuple:
+        return (
+            id(asyncio.get_running_loop()),
+            command,
+            tuple(args),
+            frozenset((env or {}).items()),
+        )
+
     async def start_mcp(
         self, 
         name: str, 
@@ -51,7 +103,7 @@ class MCPManager:
             True if server started successfully
         """
         if name in self.active_clients:
-            logger.warning(f"MCP server {name} is already running")
+            logger.warning("MCP server %s is already running", name)
             return True
         
         try:
@@ -62,22 +114,79 @@ class MCPManager:
                 "env": env or {}
             }
             
+            # Reuse an already-connected client for the same server command
+            key = self._cache_key(command, args, env)
+            cached = MCPManager._client_cache.get(key)
+            if cached is not None and cached.is_connected():
+                self.active_clients[name] = cached
+                MCPManager._client_refcounts[key] += 1
+                await self._register_server_tools(name, cached)
+                self._connected_names.add(name)
+                logger.info("Reusing existing MCP server process for: %s", name)
+                return True
+
             # Create and connect client
             client = MCPClient(name)
             success = await client.connect(command, args, env)
-            
+
             if success:
                 self.active_clients[name] = client
-                logger.info(f"Started MCP server: {name}")
+                MCPManager._client_cache[key] = client
+                MCPManager._client_refcounts[key] = 1
+                await self._register_server_tools(name, client)
+                self._connected_names.add(name)
+                logger.info("Started MCP server: %s", name)
                 return True
             else:
-                logger.error(f"Failed to start MCP server: {name}")
+                logger.error("Failed to start MCP server: %s", name)
                 return False
                 
         except Exception as e:
-            logger.error(f"Error starting MCP server {name}: {e}")
+            logger.error("Error starting MCP server %s: %s", name, e)
             return False
     
+    async def _register_server_tools(self, name: str, client: MCPClient) -> None:
+        """Index a server's tools into the lookup registry."""
+        try:
+            for tool in await client.list_tools():
+                self._tool_registry[tool.name] = (name, tool)
+        except Exception as e:
+            logger.warning("Could not index tools for %s: %s", name, e)
+
+    async def connect_all(
+        self,
+        specs: List[tuple],
+    ) -> Dict[str, bool]:
+        """
+        Start several MCP servers concurrently.
+
+        Each spec is a (name, command, args, env) tuple. All connections
+        are issued at once with asyncio.gather, so total startup latency
+        is the slowest server's spawn + handshake rather than the sum.
+
+        Args:
+            specs: List of (name, command, args, env) tuples
+
+        Returns:
+            Dictionary mapping server names to whether they started
+        """
+        results = await _gather_bounded(
+            MCP_MAX_CONCURRENCY,
+            *(
+                self.start_mcp(name, command, args, env)
+                for name, command, args, env in specs
+            ),
+        )
+
+        statuses = {}
+        for (name, *_), result in zip(specs, results):
+            if isinstance(result, BaseException):
+                logger.error("Error starting MCP server %s: %s", name, result)
+                statuses[name] = False
+            else:
+                statuses[name] = result
+        return statuses
+
     async def stop_mcp(self, name: str) -> bool:
         """
         Stop an MCP server and disconnect client.
@@ -89,42 +198,81 @@ class MCPManager:
             True if server stopped successfully
         """
         if name not in self.active_clients:
-            logger.warning(f"MCP server {name} is not running")
+            logger.warning("MCP server %s is not running", name)
             return True
         
         try:
             client = self.active_clients[name]
-            await client.disconnect()
-            
+
+            # Only disconnect when no other manager still shares this client
+            config = self._server_configs.get(name)
+            key = (
+                self._cache_key(config["command"], config["args"], config["env"])
+                if config
+                else None
+            )
+            if key is not None and key in MCPManager._client_refcounts:
+                MCPManager._client_refcounts[key] -= 1
+                if MCPManager._client_refcounts[key] <= 0:
+                    del MCPManager._client_refcounts[key]
+                    del MCPManager._client_cache[key]
+                    await client.disconnect()
+            else:
+                await client.disconnect()
+
             del self.active_clients[name]
+            self._connected_names.discard(name)
             if name in self._server_configs:
                 del self._server_configs[name]
-            
-            logger.info(f"Stopped MCP server: {name}")
+
+            # Drop this server's entries from the tool registry
+            self._tool_registry = {
+                tool_name: entry
+                for tool_name, entry in self._tool_registry.items()
+                if entry[0] != name
+            }
+
+            logger.info("Stopped MCP server: %s", name)
             return True
             
         except Exception as e:
-            logger.error(f"Error stopping MCP server {name}: {e}")
+            logger.error("Error stopping MCP server %s: %s", name, e)
             return False
     
-    async def list_all_tools(self) -> Dict[str, List[Tool]]:
+    async def list_all_tools(
+        self, servers: Optional[Iterable[str]] = None
+    ) -> Dict[str, List[Tool]]:
         """
         List all tools from all active MCP servers.
-        
+
+        Args:
+            servers: Optional subset of server names to query; when given,
+                only those servers are contacted instead of fanning out
+                to every stdio session
+
         Returns:
             Dictionary mapping server names to their tools
         """
+        # Fan out to every server at once: overall latency becomes the
+        # slowest server's round-trip instead of the sum of them all.
+        if servers is None:
+            server_names = list(self.active_clients.keys())
+        else:
+            server_names = [name for name in servers if name in self.active_clients]
+        results = await _gather_bounded(
+            MCP_MAX_CONCURRENCY,
+            *(self.active_clients[name].list_tools() for name in server_names),
+        )
+
         all_tools = {}
-        
-        for server_name, client in self.active_clients.items():
-            try:
-                tools = await client.list_tools()
-                all_tools[server_name] = tools
-                logger.debug(f"Listed {len(tools)} tools from {server_name}")
-            except Exception as e:
-                logger.error(f"Failed to list tools from {server_name}: {e}")
+        for server_name, tools in zip(server_names, results):
+            if isinstance(tools, BaseException):
+                logger.error("Failed to list tools from %s: %s", server_name, tools)
                 all_tools[server_name] = []
-        
+            else:
+                all_tools[server_name] = tools
+                logger.debug("Listed %d tools from %s", len(tools), server_name)
+
         return all_tools
     
     async def call_mcp(self, server_name: str, tool_name: str, arguments: Dict[str, Any]) -> Optional[CallToolResult]:
@@ -155,13 +303,20 @@ class MCPManager:
         Returns:
             Tuple of (server_name, tool) if found, None otherwise
         """
+        # Registry hit: one dict access, no per-server probes
+        entry = self._tool_registry.get(tool_name)
+        if entry is not None and entry[0] in self.active_clients:
+            return entry
+
+        # Fall back to probing, e.g. if indexing failed at connect time
         for server_name, client in self.active_clients.items():
             try:
                 tool = await client.get_tool(tool_name)
                 if tool:
+                    self._tool_registry[tool_name] = (server_name, tool)
                     return (server_name, tool)
             except Exception as e:
-                logger.error(f"Error searching for tool {tool_name} in {server_name}: {e}")
+                logger.error("Error searching for tool %s in %s: %s", tool_name, server_name, e)
         
         return None
     
@@ -189,8 +344,25 @@ class MCPManager:
     
     def is_server_active(self, name: str) -> bool:
         """Check if a server is active."""
-        return name in self.active_clients and self.active_clients[name].is_connected()
-    
+        # Single membership test; the set is maintained by start_mcp,
+        # stop_mcp and health_check so hot-path prechecks stay cheap
+        return name in self._connected_names
+
+    def server_status(self) -> Dict[str, bool]:
+        """
+        Get the connection state of every known server.
+
+        Covers servers that are registered but currently disconnected
+        (e.g. dropped by a failed health check), not just the connected
+        set, so callers can report both states.
+
+        Returns:
+            Dictionary mapping each known server name to True when
+            connected, False when registered but not connected
+        """
+        names = self.active_clients.keys() | self._server_configs.keys()
+        return {name: name in self._connected_names for name in names}
+
     async def health_check(self) -> Dict[str, bool]:
         """
         Check health of all active servers.
@@ -198,17 +370,25 @@ class MCPManager:
         Returns:
             Dictionary mapping server names to their health status
         """
+        # Probe every server at once, same as list_all_tools: the check
+        # costs one round-trip to the slowest server, not one per server.
+        server_names = list(self.active_clients.keys())
+        results = await _gather_bounded(
+            MCP_MAX_CONCURRENCY,
+            *(self.active_clients[name].list_tools() for name in server_names),
+        )
+
         health_status = {}
-        
-        for server_name, client in self.active_clients.items():
-            try:
-                # Try to list tools as a health check
-                await client.list_tools()
-                health_status[server_name] = True
-            except Exception as e:
-                logger.warning(f"Health check failed for {server_name}: {e}")
+        for server_name, result in zip(server_names, results):
+            if isinstance(result, BaseException):
+                logger.warning("Health check failed for %s: %s", server_name, result)
                 health_status[server_name] = False
-        
+                # Observed disconnect: keep the fast-path set authoritative
+                self._connected_names.discard(server_name)
+            else:
+                health_status[server_name] = True
+                self._connected_names.add(server_name)
+
         return health_status
     
     async def restart_server(self, name: str) -> bool:
@@ -222,35 +402,51 @@ class MCPManager:
             True if restart was successful
         """
         if name not in self._server_configs:
-            logger.error(f"No configuration found for server {name}")
+            logger.error("No configuration found for server %s", name)
             return False
         
         config = self._server_configs[name]
-        
-        # Stop the server
+
+        # Stop the server; with no other holders this disconnects the
+        # process, so start_mcp below spawns a fresh one
         await self.stop_mcp(name)
-        
-        # Wait a moment
-        await asyncio.sleep(1)
-        
+
+        # Exponential backoff with jitter: first retry is fast, repeated
+        # failures back off up to 60s, and the jitter keeps many managers
+        # from restarting in lockstep
+        attempt = self._restart_attempts.get(name, 0)
+        delay = min(60.0, 0.25 * (2 ** attempt)) * (1 + random.uniform(-0.2, 0.2))
+        await asyncio.sleep(delay)
+
         # Start the server again
-        return await self.start_mcp(
+        success = await self.start_mcp(
             name,
             config["command"],
             config["args"],
             config["env"]
         )
+        if success:
+            self._restart_attempts.pop(name, None)
+        else:
+            self._restart_attempts[name] = attempt + 1
+        return success
     
     async def cleanup(self):
         """Clean up all resources and disconnect from all servers."""
         logger.info("Cleaning up MCP manager...")
         
-        # Disconnect from all servers
-        for server_name in list(self.active_clients.keys()):
-            await self.stop_mcp(server_name)
-        
+        # Stop all servers concurrently: shutdown costs the slowest
+        # teardown instead of the sum
+        server_names = list(self.active_clients.keys())
+        if server_names:
+            await asyncio.gather(
+                *(self.stop_mcp(name) for name in server_names),
+                return_exceptions=True,
+            )
+
         self.active_clients.clear()
         self._server_configs.clear()
+        self._connected_names.clear()
         
         logger.info("MCP manager cleanup completed")
     
@@ -267,3 +463,45 @@ class MCPManager:
         server_names = list(self.active_clients.keys())
         return f"MCPManager(active_servers={active_count}, servers={server_names})"
 
+
+# Process-wide shared manager. Scripts and engines that each used to build
+# their own MCPManager (re-spawning the same servers) can share one warm
+# instance instead; cleanup only happens when the last holder releases it.
+_shared_manager: Optional[MCPManager] = None
+_shared_refcount = 0
+
+
+def get_shared_manager() -> MCPManager:
+    """
+    Get the process-wide shared MCPManager, creating it lazily.
+
+    Each call takes a reference; pair it with release_shared_manager()
+    so servers stay warm while any holder is still using them.
+    """
+    global _shared_manager, _shared_refcount
+
+    if _shared_manager is None:
+        _shared_manager = MCPManager()
+    _shared_refcount += 1
+    return _shared_manager
+
+
+async def release_shared_manager() -> None:
+    """
+    Release one reference to the shared manager.
+
+    The underlying manager (and its server processes) is only cleaned up
+    when the reference count drops to zero.
+    """
+    global _shared_manager, _shared_refcount
+
+    if _shared_manager is None:
+        return
+
+    _shared_refcount -= 1
+    if _shared_refcount <= 0:
+        manager = _shared_manager
+        _shared_manager = None
+        _shared_refcount = 0
+        await manager.cleanup()
+
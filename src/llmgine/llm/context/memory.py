@@ -16,10 +16,15 @@ class SimpleChatHistory:
         self.session_id = session_id
         self.chat_history: List[Dict[str, Any]] = []
         self.system_prompt: Optional[str] = None
-    
+        self._system_message: Optional[Dict[str, Any]] = None
+
     def set_system_prompt(self, prompt: str) -> None:
         """Set the system prompt."""
         self.system_prompt = prompt
+        # Serialize once: the prompt is constant after setup, so every
+        # get_messages call prepends this dict by reference instead of
+        # rebuilding it per turn.
+        self._system_message = {"role": "system", "content": prompt}
     
     def add_user_message(self, content: str) -> None:
         """Add a user message."""
@@ -66,11 +71,9 @@ class SimpleChatHistory:
     
     def get_messages(self) -> List[Dict[str, Any]]:
         """Get all messages including system prompt."""
-        messages = []
-        if self.system_prompt:
-            messages.append({"role": "system", "content": self.system_prompt})
-        messages.extend(self.chat_history)
-        return messages
+        if self._system_message is not None:
+            return [self._system_message, *self.chat_history]
+        return list(self.chat_history)
     
     def clear(self) -> None:
         """Clear chat history but keep system prompt."""
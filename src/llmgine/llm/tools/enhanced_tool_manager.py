@@ -5,25 +5,73 @@ This module provides an enhanced ToolManager that maintains backward compatibili
 with the existing llmgine ToolManager while adding powerful MCP capabilities.
 """
 
+from __future__ import annotations
+
 import asyncio
-import inspect
+import hashlib
 import json
 import logging
-from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional
+import os
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Set
 
 from llmgine.llm import AsyncOrSyncToolFunction
 from llmgine.llm.tools.toolCall import ToolCall
-from llmgine.llm.tools.tool_manager import ToolManager
+from llmgine.llm.tools.tool_manager import ToolManager, _json_loads
+
+if TYPE_CHECKING:
+    from any_mcp.integration.tool_adapter import LLMgineToolAdapter
+    from any_mcp.managers.manager import MCPManager
+
+try:
+    # Same optional dependency as tool_manager: orjson serializes to bytes
+    # in native code, skipping the intermediate Python string entirely
+    import orjson
+
+    def _canonical_args(args: Dict[str, Any]) -> bytes:
+        return orjson.dumps(args, option=orjson.OPT_SORT_KEYS, default=str)
+except ImportError:
+    def _canonical_args(args: Dict[str, Any]) -> bytes:
+        return json.dumps(args, sort_keys=True, default=str).encode()
+
+
+def _args_key(name: str, args: Dict[str, Any]) -> str:
+    """Stable cache key for a tool call: name plus hashed canonical args.
+
+    blake2b at 16 bytes is a few times cheaper than sha256 and still far
+    beyond collision range for cache keying.
+    """
+    digest = hashlib.blake2b(_canonical_args(args), digest_size=16).hexdigest()
+    return f"{name}:{digest}"
 
-# Import our any-mcp components
-from any_mcp.managers.manager import MCPManager
-from any_mcp.integration.tool_adapter import LLMgineToolAdapter
 
 if TYPE_CHECKING:
     from llmgine.llm.context.memory import SimpleChatHistory
 
 logger = logging.getLogger(__name__)
 
+# Maximum in-flight calls per MCP server stdio pipe
+_MCP_MAX_CONCURRENT = 8
+
+# How long a completed schema refresh stays fresh; refresh requests inside
+# this window (e.g. a burst of register_tool calls) are dropped
+_REFRESH_TTL = 1.0
+
+# Quiet period before a registration-triggered schema refresh fires;
+# every registration inside the window pushes the refresh back
+_DEBOUNCE_MS = 100
+
+# Opt-in memoization: only MCP tools whose bare name signals a read-only
+# operation are result-cached; anything else always hits the server.
+# Tools can be opted in or out individually regardless of name.
+_MEMO_PREFIXES = ("read_", "list_", "search_")
+_MEMO_CACHE_MAX = 256
+
+# Raw argument-string -> parsed dict cache; LLMs often replay identical
+# payloads, so repeats skip the JSON parse entirely
+_ARGS_CACHE_MAX = 512
+
 
 class EnhancedToolManager(ToolManager):
     """
@@ -36,10 +84,26 @@ class EnhancedToolManager(ToolManager):
     - Advanced tool discovery and management
     """
     
-    def __init__(self, chat_history: Optional["SimpleChatHistory"] = None):
-        """Initialize enhanced tool manager."""
+    def __init__(
+        self,
+        chat_history: Optional["SimpleChatHistory"] = None,
+        max_concurrent_tool_calls: Optional[int] = None,
+    ):
+        """Initialize enhanced tool manager.
+
+        Args:
+            chat_history: Optional chat history
+            max_concurrent_tool_calls: Cap on in-flight calls per batch;
+                defaults to the MCP_TOOL_CONCURRENCY env var (8 if unset).
+        """
         # Initialize parent class
         super().__init__(chat_history)
+
+        # Batch-level backpressure: oversized tool_calls arrays queue behind
+        # this semaphore instead of all firing at once
+        if max_concurrent_tool_calls is None:
+            max_concurrent_tool_calls = int(os.getenv("MCP_TOOL_CONCURRENCY", "8"))
+        self._tool_concurrency = asyncio.Semaphore(max_concurrent_tool_calls)
         
         # MCP components
         self.mcp_manager: Optional[MCPManager] = None
@@ -48,6 +112,45 @@ class EnhancedToolManager(ToolManager):
         
         # Combined tool tracking
         self._mcp_tools_cache: List[Dict[str, Any]] = []
+        # Single name -> "local"/"mcp" tag map so dispatch and the
+        # is_local_tool/is_mcp_tool checks cost one hash lookup each
+        self._name_kind: Dict[str, str] = {}
+        # Serializes schema refreshes when servers are added concurrently
+        self._refresh_lock = asyncio.Lock()
+        # Coalescing state: one in-flight refresh shared by all callers,
+        # plus a freshness stamp so bursts collapse to a single round-trip
+        self._refresh_inflight: Optional[asyncio.Task] = None
+        self._refresh_cached_at: float = 0.0
+        # Trailing-edge debounce for registration-triggered refreshes
+        self._refresh_debounce_task: Optional[asyncio.Task] = None
+        # Local schemas rebuilt only when the tools dict changes size
+        self._local_schema_cache: Optional[List[Dict[str, Any]]] = None
+        self._local_schema_count = -1
+
+        # Per-server concurrency caps: each MCP server is a single stdio
+        # pipe, so unbounded gather fan-out would just queue head-of-line.
+        # Local sync tools are already bounded by the shared thread pool.
+        self._mcp_semaphores: Dict[str, asyncio.Semaphore] = {}
+
+        # Memoized results for read-only MCP tools. Prefix matching is a
+        # heuristic; these sets override it in either direction so a
+        # stateful search_* tool can be excluded and a read-only tool
+        # with an unconventional name included.
+        self._memo_cache: "OrderedDict[str, Any]" = OrderedDict()
+        self._memo_opt_in: Set[str] = set()
+        self._memo_opt_out: Set[str] = set()
+        # Single-flight registry: identical MCP calls issued while the
+        # first is still in flight share one round-trip, whether or not
+        # the tool's result is memoizable
+        self._inflight: Dict[str, asyncio.Task] = {}
+
+        # Parsed-arguments cache keyed on the raw JSON string. Parsed dicts
+        # are shared, not copied: the dispatch path only reads them.
+        self._args_parse_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+
+        # Cached list_all_tools snapshot, rebuilt only when registrations
+        # or connection state dirty it — status endpoints poll this often
+        self._status_snapshot: Optional[Dict[str, Any]] = None
         
         logger.info("Initialized EnhancedToolManager with MCP support")
     
@@ -62,7 +165,12 @@ class EnhancedToolManager(ToolManager):
             return True
         
         try:
-            # Initialize MCP manager
+            # Imported here, not at module top: the any_mcp/mcp stack pulls
+            # in pydantic and anyio, which processes that never enable MCP
+            # shouldn't pay for at import time
+            from any_mcp.integration.tool_adapter import LLMgineToolAdapter
+            from any_mcp.managers.manager import MCPManager
+
             self.mcp_manager = MCPManager()
             self.tool_adapter = LLMgineToolAdapter(self.mcp_manager)
             
@@ -71,19 +179,29 @@ class EnhancedToolManager(ToolManager):
             return True
             
         except Exception as e:
-            logger.error(f"Failed to initialize MCP system: {e}")
+            logger.error("Failed to initialize MCP system: %s", e)
             return False
     
-    async def add_mcp_server(self, name: str, command: str, args: List[str], env: Optional[Dict[str, str]] = None) -> bool:
+    async def add_mcp_server(
+        self,
+        name: str,
+        command: str,
+        args: List[str],
+        env: Optional[Dict[str, str]] = None,
+        refresh: bool = True,
+    ) -> bool:
         """
         Add and start an MCP server.
-        
+
         Args:
             name: Unique name for the MCP server
             command: Command to run the server
             args: Arguments for the server command
             env: Environment variables for the server
-            
+            refresh: Refresh combined tool schemas after startup. Callers
+                starting several servers at once can pass False and issue a
+                single refresh afterwards.
+
         Returns:
             True if server was added successfully
         """
@@ -99,62 +217,153 @@ class EnhancedToolManager(ToolManager):
         success = await self.mcp_manager.start_mcp(name, command, args, env)
         
         if success:
-            # Refresh tool schemas
-            await self._refresh_mcp_tools()
-            logger.info(f"Added MCP server: {name}")
+            self._mcp_semaphores[name] = asyncio.Semaphore(_MCP_MAX_CONCURRENT)
+            if refresh:
+                # Refresh tool schemas (bypassing the TTL: the tool set
+                # definitely changed)
+                await self._refresh_mcp_tools(force=True)
+            logger.info("Added MCP server: %s", name)
         
         return success
     
-    async def _refresh_mcp_tools(self):
-        """Refresh MCP tools and update combined tool schemas."""
+    async def _refresh_mcp_tools(self, force: bool = False):
+        """Refresh MCP tools and update combined tool schemas.
+
+        Concurrent callers share one in-flight refresh, and repeat calls
+        within the TTL window are no-ops unless force is set — a burst of
+        registrations costs one set of MCP round-trips, not one each.
+        """
         if not self.tool_adapter:
             return
-        
+
+        if not force and time.monotonic() - self._refresh_cached_at < _REFRESH_TTL:
+            return
+
+        inflight = self._refresh_inflight
+        if inflight is not None and not inflight.done():
+            await asyncio.shield(inflight)
+            return
+
+        task = asyncio.create_task(self._do_refresh())
+        self._refresh_inflight = task
         try:
-            # Get MCP tool schemas
-            mcp_schemas = await self.tool_adapter.get_all_openai_schemas()
-            
-            # Update combined tool schemas
-            self.tool_schemas = self._get_local_schemas() + mcp_schemas
-            
-            # Cache MCP tools info
-            self._mcp_tools_cache = await self.tool_adapter.list_available_tools()
-            
-            logger.debug(f"Refreshed {len(mcp_schemas)} MCP tool schemas")
-            
+            await task
+        finally:
+            if self._refresh_inflight is task:
+                self._refresh_inflight = None
+
+    async def _do_refresh(self):
+        try:
+            async with self._refresh_lock:
+                # Get MCP tool schemas
+                mcp_schemas = await self.tool_adapter.get_all_openai_schemas()
+
+                # Update combined tool schemas
+                self.tool_schemas = self._get_local_schemas() + mcp_schemas
+
+                # Cache MCP tools info
+                self._mcp_tools_cache = await self.tool_adapter.list_available_tools()
+
+                # Rebuild the tag map: bare and server-prefixed names both
+                # resolve as MCP tools
+                name_kind = {name: "local" for name in self.tools}
+                for tool in self._mcp_tools_cache:
+                    name_kind[tool["tool_name"]] = "mcp"
+                    name_kind[f"{tool['mcp_name']}_{tool['tool_name']}"] = "mcp"
+                self._name_kind = name_kind
+
+                self._refresh_cached_at = time.monotonic()
+                self._status_snapshot = None
+                logger.debug("Refreshed %d MCP tool schemas", len(mcp_schemas))
+
         except Exception as e:
-            logger.error(f"Failed to refresh MCP tools: {e}")
+            logger.error("Failed to refresh MCP tools: %s", e)
     
     def _get_local_schemas(self) -> List[Dict[str, Any]]:
         """Get schemas for local (non-MCP) tools."""
+        # Rebuild only when the tools dict has actually changed
+        if (
+            self._local_schema_cache is not None
+            and self._local_schema_count == len(self.tools)
+        ):
+            return self._local_schema_cache
+
         local_schemas = []
-        
+
         for tool_name, tool_func in self.tools.items():
             try:
                 schema = self._generate_tool_schema(tool_func)
                 local_schemas.append(schema)
             except Exception as e:
-                logger.error(f"Failed to generate schema for local tool {tool_name}: {e}")
-        
+                logger.error("Failed to generate schema for local tool %s: %s", tool_name, e)
+
+        self._local_schema_cache = local_schemas
+        self._local_schema_count = len(self.tools)
         return local_schemas
     
     def register_tool(self, func: AsyncOrSyncToolFunction) -> None:
         """Register a function as a tool (maintains backward compatibility)."""
         # Call parent method
         super().register_tool(func)
-        
-        # If MCP is initialized, refresh combined schemas
+        self._name_kind[func.__name__] = "local"
+        self._status_snapshot = None
+
+        # If MCP is initialized, debounce the combined-schema refresh so a
+        # burst of registrations triggers one refresh after the quiet period
         if self._mcp_initialized:
-            asyncio.create_task(self._refresh_mcp_tools())
-    
+            self._schedule_debounced_refresh()
+
+    def _schedule_debounced_refresh(self) -> None:
+        """(Re)arm the trailing-edge refresh timer."""
+        if self._refresh_debounce_task is not None:
+            self._refresh_debounce_task.cancel()
+        self._refresh_debounce_task = asyncio.create_task(self._debounced_refresh())
+
+    async def _debounced_refresh(self) -> None:
+        await asyncio.sleep(_DEBOUNCE_MS / 1000)
+        self._refresh_debounce_task = None
+        await self._refresh_mcp_tools(force=True)
+
+    def register_tools(self, funcs: List[AsyncOrSyncToolFunction]) -> None:
+        """Register several tools with a single combined-schema refresh."""
+        for func in funcs:
+            ToolManager.register_tool(self, func)
+            self._name_kind[func.__name__] = "local"
+        self._status_snapshot = None
+
+        if self._mcp_initialized:
+            self._schedule_debounced_refresh()
+
+    async def execute_tool_calls(self, tool_calls: List[ToolCall]) -> List[Any]:
+        """Execute multiple tool calls with bounded concurrency."""
+        if len(tool_calls) <= 1:
+            return await super().execute_tool_calls(tool_calls)
+
+        async def gated(tool_call: ToolCall) -> Any:
+            async with self._tool_concurrency:
+                return await self.execute_tool_call(tool_call)
+
+        results = await asyncio.gather(
+            *(gated(tool_call) for tool_call in tool_calls),
+            return_exceptions=True,
+        )
+        return [
+            f"Error executing {tool_call.name}: {result!s}"
+            if isinstance(result, BaseException)
+            else result
+            for tool_call, result in zip(tool_calls, results)
+        ]
+
     async def execute_tool_call(self, tool_call: ToolCall) -> Any:
         """Execute a single tool call (enhanced with MCP support)."""
         tool_name = tool_call.name
-        
-        # Check if it's a local tool first
-        if tool_name in self.tools:
+
+        # Single tag lookup decides the dispatch path; fall back to the
+        # local-tool dict for tools registered outside register_tool.
+        kind = self._name_kind.get(tool_name)
+        if kind == "local" or (kind is None and tool_name in self.tools):
             return await super().execute_tool_call(tool_call)
-        
+
         # Try to execute as MCP tool
         if self._mcp_initialized and self.tool_adapter:
             return await self._execute_mcp_tool(tool_call)
@@ -168,12 +377,20 @@ class EnhancedToolManager(ToolManager):
             return "Error: MCP system not initialized"
         
         try:
-            # Parse arguments
+            # Parse arguments, reusing the parsed dict for replayed strings
             if isinstance(tool_call.arguments, str):
-                if tool_call.arguments.strip() == "":
+                raw = tool_call.arguments
+                if not raw or raw.isspace():
                     args = {}
                 else:
-                    args = json.loads(tool_call.arguments)
+                    args = self._args_parse_cache.get(raw)
+                    if args is None:
+                        args = _json_loads(raw)
+                        self._args_parse_cache[raw] = args
+                        if len(self._args_parse_cache) > _ARGS_CACHE_MAX:
+                            self._args_parse_cache.popitem(last=False)
+                    else:
+                        self._args_parse_cache.move_to_end(raw)
             else:
                 args = tool_call.arguments
             
@@ -181,18 +398,99 @@ class EnhancedToolManager(ToolManager):
             if not args:
                 args = {}
             
-            # Execute through tool adapter
-            result = await self.tool_adapter.execute_tool(tool_call.name, args)
-            
+            server_name, bare_name = self.tool_adapter.parse_tool_name(tool_call.name)
+            key = _args_key(tool_call.name, args)
+
+            # Read-only tools get memoized: a repeat of the same call in a
+            # session returns the cached value
+            memoized = self._tool_is_memoizable(bare_name)
+            if memoized:
+                cached = self._memo_cache.get(key)
+                if cached is not None:
+                    self._memo_cache.move_to_end(key)
+                    return cached
+
+            # Single-flight: identical concurrent calls (memoizable or
+            # not) await the round-trip already in progress instead of
+            # issuing their own
+            inflight = self._inflight.get(key)
+            if inflight is not None:
+                result = await asyncio.shield(inflight)
+            else:
+                task = asyncio.create_task(
+                    self._dispatch_mcp_tool(tool_call.name, server_name, args)
+                )
+                self._inflight[key] = task
+                try:
+                    result = await task
+                finally:
+                    self._inflight.pop(key, None)
+
             if result["success"]:
+                if memoized:
+                    self._memo_cache[key] = result["result"]
+                    if len(self._memo_cache) > _MEMO_CACHE_MAX:
+                        self._memo_cache.popitem(last=False)
                 return result["result"]
             else:
                 return f"Error: {result.get('error', 'MCP tool execution failed')}"
                 
         except Exception as e:
-            logger.error(f"Error executing MCP tool {tool_call.name}: {e}")
+            logger.error("Error executing MCP tool %s: %s", tool_call.name, e)
             return f"Error executing MCP tool {tool_call.name}: {str(e)}"
     
+    async def _dispatch_mcp_tool(
+        self, full_name: str, server_name: str, args: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Forward a call to the adapter, gated by the server's semaphore."""
+        semaphore = self._mcp_semaphores.get(server_name)
+        if semaphore is not None:
+            async with semaphore:
+                return await self.tool_adapter.execute_tool(full_name, args)
+        return await self.tool_adapter.execute_tool(full_name, args)
+
+    def _tool_is_memoizable(self, bare_name: str) -> bool:
+        """Decide whether an MCP tool's results may be memoized."""
+        if bare_name in self._memo_opt_out:
+            return False
+        return bare_name in self._memo_opt_in or bare_name.startswith(
+            _MEMO_PREFIXES
+        )
+
+    def mark_tool_memoizable(self, tool_name: str) -> None:
+        """Opt a read-only/idempotent MCP tool into result memoization.
+
+        Args:
+            tool_name: Bare tool name (no server prefix)
+        """
+        self._memo_opt_out.discard(tool_name)
+        self._memo_opt_in.add(tool_name)
+
+    def mark_tool_non_memoizable(self, tool_name: str) -> None:
+        """Opt an MCP tool out of result memoization.
+
+        Use this for stateful tools whose names match the read-only
+        prefixes. Already-cached results for the tool are dropped so the
+        next call reaches the server.
+
+        Args:
+            tool_name: Bare tool name (no server prefix)
+        """
+        self._memo_opt_in.discard(tool_name)
+        self._memo_opt_out.add(tool_name)
+        for key in [
+            k
+            for k in self._memo_cache
+            if self.tool_adapter
+            and self.tool_adapter.parse_tool_name(k.rsplit(":", 1)[0])[1]
+            == tool_name
+        ]:
+            del self._memo_cache[key]
+
+    def clear_memo_cache(self) -> None:
+        """Drop memoized MCP results, e.g. at a session boundary."""
+        self._memo_cache.clear()
+
     def parse_tools_to_list(self) -> List[Dict[str, Any]]:
         """Get all tools in OpenAI format for litellm (enhanced with MCP tools)."""
         return self.tool_schemas if self.tool_schemas else []
@@ -204,23 +502,24 @@ class EnhancedToolManager(ToolManager):
         Returns:
             Dictionary with tool information
         """
-        local_tools = list(self.tools.keys())
-        mcp_tools = self._mcp_tools_cache.copy()
-        
-        # Get MCP server status
-        mcp_servers = {}
+        # Serve the cached snapshot unless a registration or refresh
+        # dirtied it; the connection-state check below is one dict build
+        # instead of an is_connected() call per client
+        mcp_servers: Dict[str, bool] = {}
         if self.mcp_manager:
-            mcp_servers = {
-                name: client.is_connected() 
-                for name, client in self.mcp_manager.active_clients.items()
-            }
-        
-        return {
-            "local_tools": local_tools,
-            "mcp_tools": mcp_tools,
+            mcp_servers = self.mcp_manager.server_status()
+        if self._status_snapshot is not None:
+            snapshot = self._status_snapshot
+            if snapshot["mcp_servers"] == mcp_servers:
+                return snapshot
+
+        self._status_snapshot = {
+            "local_tools": list(self.tools.keys()),
+            "mcp_tools": list(self._mcp_tools_cache),
             "mcp_servers": mcp_servers,
             "total_schemas": len(self.tool_schemas)
         }
+        return self._status_snapshot
     
     async def get_mcp_server_status(self) -> Dict[str, bool]:
         """Get status of all MCP servers."""
@@ -231,11 +530,8 @@ class EnhancedToolManager(ToolManager):
     
     def is_mcp_tool(self, tool_name: str) -> bool:
         """Check if a tool name corresponds to an MCP tool."""
-        return any(
-            tool["tool_name"] == tool_name or f"{tool['mcp_name']}_{tool['tool_name']}" == tool_name
-            for tool in self._mcp_tools_cache
-        )
-    
+        return self._name_kind.get(tool_name) == "mcp"
+
     def is_local_tool(self, tool_name: str) -> bool:
         """Check if a tool name corresponds to a local tool."""
         return tool_name in self.tools
@@ -249,7 +545,9 @@ class EnhancedToolManager(ToolManager):
 
 class MCPServerConfig:
     """Configuration for an MCP server."""
-    
+
+    __slots__ = ("name", "command", "args", "env")
+
     def __init__(self, name: str, command: str, args: List[str], env: Optional[Dict[str, str]] = None):
         self.name = name
         self.command = command
@@ -276,16 +574,31 @@ async def create_enhanced_tool_manager_with_servers(
     # Initialize MCP
     await manager.initialize_mcp()
     
-    # Add MCP servers
+    # Start all MCP servers concurrently: each spawn + handshake is
+    # independent, so total startup cost is the slowest server, not the sum.
     if mcp_servers:
-        for server_config in mcp_servers:
-            await manager.add_mcp_server(
-                server_config.name,
-                server_config.command,
-                server_config.args,
-                server_config.env
-            )
-    
+        from any_mcp.managers.manager import MCP_MAX_CONCURRENCY, _gather_bounded
+
+        results = await _gather_bounded(
+            MCP_MAX_CONCURRENCY,
+            *(
+                manager.add_mcp_server(
+                    server_config.name,
+                    server_config.command,
+                    server_config.args,
+                    server_config.env,
+                    refresh=False,
+                )
+                for server_config in mcp_servers
+            ),
+        )
+        for server_config, result in zip(mcp_servers, results):
+            if isinstance(result, BaseException) or not result:
+                logger.error("Failed to start MCP server: %s", server_config.name)
+
+        # One combined schema refresh for the whole batch
+        await manager._refresh_mcp_tools(force=True)
+
     return manager
 
 
@@ -16,14 +16,24 @@ logger = logging.getLogger(__name__)
 
 class MCPToolAdapter:
     """Adapter that converts MCP tools to work with LLMgine's ToolManager."""
-    
+
+    __slots__ = ("mcp_client",)
+
     def __init__(self, mcp_client: SimpleMCPClient):
         self.mcp_client = mcp_client
     
     def convert_mcp_tool_to_schema(self, mcp_tool: Tool) -> Dict[str, Any]:
         """Convert MCP tool to OpenAI-format schema for LLMgine."""
+        # Cache the converted schema on the Tool object itself (same trick
+        # register_tool uses with func._tool_schema): tools live for the
+        # server's lifetime, so each is converted at most once no matter
+        # how many refreshes run.
+        schema = getattr(mcp_tool, "_llmgine_schema", None)
+        if schema is not None:
+            return schema
+
         # MCP tools already have JSON schema format, just adapt to OpenAI format
-        return {
+        schema = {
             "type": "function",
             "function": {
                 "name": mcp_tool.name,
@@ -35,25 +45,33 @@ class MCPToolAdapter:
                 }
             }
         }
+        try:
+            object.__setattr__(mcp_tool, "_llmgine_schema", schema)
+        except (AttributeError, TypeError):
+            pass  # Models that reject extra attributes just skip the cache
+        return schema
     
     def create_mcp_tool_function(self, tool_name: str):
         """Create a function that calls the MCP tool."""
-        async def mcp_tool_wrapper(**kwargs) -> str:
-            """Wrapper function that calls MCP tool and returns string result."""
+        async def call_with_dict(arguments: Dict[str, Any]) -> str:
+            """Call the MCP tool with an already-parsed arguments dict."""
             try:
-                # Call the MCP tool
-                result = await self.mcp_client.call_tool(tool_name, kwargs)
-                
-                # Convert result to string
+                result = await self.mcp_client.call_tool(tool_name, arguments)
                 return self._convert_result_to_string(result)
-                
             except Exception as e:
                 logger.error(f"Error calling MCP tool {tool_name}: {e}")
                 return f"Error: {str(e)}"
+
+        async def mcp_tool_wrapper(**kwargs) -> str:
+            """Wrapper function that calls MCP tool and returns string result."""
+            return await call_with_dict(kwargs)
         
         # Set function name for registration
         mcp_tool_wrapper.__name__ = tool_name
         mcp_tool_wrapper.__doc__ = f"MCP tool: {tool_name}"
+        # Direct-dispatch entry point: ToolManager hands the parsed dict
+        # straight through, skipping the **kwargs unpack/repack
+        mcp_tool_wrapper._mcp_call = call_with_dict
         
         return mcp_tool_wrapper
     
@@ -72,19 +90,26 @@ class MCPToolAdapter:
     def _extract_text_content(self, result: CallToolResult) -> str:
         """Extract text content from MCP result."""
         try:
-            if hasattr(result, 'content') and result.content:
-                # Try to get text from content items
-                text_parts = []
-                for item in result.content:
-                    if hasattr(item, 'text') and item.text:
-                        text_parts.append(item.text)
-                
-                if text_parts:
-                    return " ".join(text_parts)
-            
+            content = getattr(result, 'content', None)
+            if not content:
+                return str(result)
+
+            # Single-item results are the common case: return the text
+            # directly, no list accumulation or join
+            if len(content) == 1:
+                return getattr(content[0], 'text', None) or str(result)
+
+            text_parts = [
+                text
+                for item in content
+                if (text := getattr(item, 'text', None))
+            ]
+            if text_parts:
+                return " ".join(text_parts)
+
             # Fallback to string representation
             return str(result)
-            
+
         except Exception as e:
-            logger.error(f"Error extracting text from MCP result: {e}")
+            logger.error("Error extracting text from MCP result: %s", e)
             return str(result)
\ No newline at end of file
@@ -18,7 +18,11 @@ logger = logging.getLogger(__name__)
 
 class SimpleMCPClient:
     """Simple MCP client that spawns subprocess and handles basic communication."""
-    
+
+    # No __dict__ per instance: fixed slots cut ~250 bytes each and make
+    # attribute access a C-level slot load
+    __slots__ = ("server_name", "session", "exit_stack", "_connected", "_tools")
+
     def __init__(self, server_name: str):
         self.server_name = server_name
         self.session: Optional[ClientSession] = None
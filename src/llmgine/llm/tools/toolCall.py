@@ -1,16 +1,27 @@
+import sys
 from dataclasses import dataclass
 from typing import Any, Dict
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ToolCall:
-    """Represents a tool call from an LLM."""
+    """Represents a tool call from an LLM.
+
+    Slotted and frozen: agent loops allocate one of these per tool call, so
+    skipping the per-instance ``__dict__`` measurably trims allocation cost.
+    """
 
     id: str
     type: str = "function"
     name: str = ""
     arguments: str = "{}"
 
+    def __post_init__(self) -> None:
+        # Interned names turn the registry dict lookup at dispatch time
+        # into a pointer comparison against the interned registration key
+        if self.name:
+            object.__setattr__(self, "name", sys.intern(self.name))
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert tool call to dictionary format."""
         return {
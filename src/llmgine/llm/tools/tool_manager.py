@@ -5,180 +5,432 @@ Now supports both local tools and MCP tools.
 """
 
 import asyncio
+import functools
 import inspect
 import json
 import logging
-from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional
+import os
+import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Union,
+    get_args,
+    get_origin,
+)
 
 from llmgine.llm import AsyncOrSyncToolFunction
 from llmgine.llm.tools.toolCall import ToolCall
 
+try:
+    # orjson parses JSON several times faster than the stdlib; fall back
+    # silently when it isn't installed.
+    import orjson
+
+    _json_loads = orjson.loads
+
+    def _json_dumps_bytes(obj: Any) -> bytes:
+        return orjson.dumps(obj)
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps_bytes(obj: Any) -> bytes:
+        return json.dumps(obj).encode()
+
 if TYPE_CHECKING:
     from llmgine.llm.context.memory import SimpleChatHistory
 
 logger = logging.getLogger(__name__)
 
+# Shared, bounded pool for sync tool offload. Threads are spawned on demand,
+# so idle managers cost nothing; a single pool keeps the thread count bounded
+# no matter how many managers exist.
+_SYNC_TOOL_EXECUTOR = ThreadPoolExecutor(
+    max_workers=min(32, (os.cpu_count() or 1) * 4),
+    thread_name_prefix="tool-",
+)
+
+# Argument payloads above this size are parsed off the event loop; a
+# multi-hundred-KB JSON parse inline would stall every other coroutine
+_PARSE_OFFLOAD_BYTES = 65536
+
+
+def _empty_messages() -> List[Dict[str, Any]]:
+    """Fallback message source for managers without a chat history."""
+    return []
+
+
+# Pre-parsed error templates: bound .format skips re-parsing the template
+# string on error-heavy paths
+_ERR_NOT_FOUND = "Error: Tool '{}' not found".format
+_ERR_EXEC = "Error executing {}: {}".format
+
+# Annotation -> JSON-schema type, replacing the old comparison ladder
+# with one hash lookup per parameter
+_TYPE_MAP = {
+    int: "integer",
+    float: "number",
+    bool: "boolean",
+    str: "string",
+    list: "array",
+    dict: "object",
+    List: "array",
+    Dict: "object",
+}
+
+
+# One pass over the docstring collects every :param name: description,
+# instead of a full-string find per parameter
+_PARAM_RE = re.compile(r":param (\w+):\s*([^\n]*)")
+
+
+def _fast_sig(func: Callable) -> tuple:
+    """Read parameter names, annotations and required-ness from the code
+    object directly, skipping inspect.signature's Parameter construction.
+
+    Returns (names, annotations, required) or None when the callable has
+    no code object (builtins, partials) and needs the inspect fallback.
+    """
+    # Follow __wrapped__ first: a functools.wraps-decorated tool carries
+    # the decorator's code object, whose co_varnames say nothing about
+    # the real parameters
+    func = inspect.unwrap(func)
+    code = getattr(func, "__code__", None)
+    if code is None:
+        return None
+
+    argcount = code.co_argcount
+    names = list(code.co_varnames[:argcount])
+    kwonly = list(code.co_varnames[argcount:argcount + code.co_kwonlyargcount])
+
+    defaults = func.__defaults__ or ()
+    kwdefaults = func.__kwdefaults__ or {}
+    required = set(names[:argcount - len(defaults)])
+    required.update(name for name in kwonly if name not in kwdefaults)
+
+    return names + kwonly, func.__annotations__, required
+
+
+def _resolve_annotation(annotation: Any) -> Any:
+    """Reduce an annotation to the bare type used for schema mapping.
+
+    Optional[X]/Union[X, None] resolves to the first non-None member;
+    generics resolve to their origin (List[int] -> list).
+    """
+    origin = get_origin(annotation)
+    if origin is Union:
+        for arg in get_args(annotation):
+            if arg is not type(None):
+                return get_origin(arg) or arg
+        return type(None)
+    return origin or annotation
+
+
+# annotation object -> resolved JSON-schema type. typing constructs are
+# cached singletons (Optional[int] is Optional[int]), so tools sharing
+# annotation shapes — e.g. a whole MCP server's worth — resolve each
+# distinct annotation once and hit this dict thereafter.
+_SCHEMA_TYPE_CACHE: Dict[Any, str] = {}
+
+
+def _schema_type(annotation: Any) -> str:
+    """Memoized annotation -> JSON-schema type resolution."""
+    try:
+        cached = _SCHEMA_TYPE_CACHE.get(annotation)
+    except TypeError:  # unhashable annotation: resolve without caching
+        return _TYPE_MAP.get(_resolve_annotation(annotation), "string")
+    if cached is None:
+        cached = _SCHEMA_TYPE_CACHE[annotation] = _TYPE_MAP.get(
+            _resolve_annotation(annotation), "string"
+        )
+    return cached
+
+
+@functools.lru_cache(maxsize=1024)
+def _generate_tool_schema(func: Callable) -> Dict[str, Any]:
+    """Generate OpenAI-format tool schema from function.
+
+    Memoized on the function object: the inspect/typing reflection walk
+    runs once per callable no matter how many managers register it, which
+    also covers builtins and bound methods that reject the _tool_schema
+    attribute cache.
+    """
+    doc = inspect.getdoc(func) or f"Function {func.__name__}"
+    
+    properties = {}
+    required = []
+    param_descs = dict(_PARAM_RE.findall(doc))
+
+    fast = _fast_sig(func)
+    if fast is not None:
+        names, annotations, required_names = fast
+    else:
+        # Builtins and other C callables: fall back to full introspection
+        sig = inspect.signature(func)
+        names = list(sig.parameters)
+        annotations = {
+            name: param.annotation
+            for name, param in sig.parameters.items()
+            if param.annotation is not inspect.Parameter.empty
+        }
+        required_names = {
+            name
+            for name, param in sig.parameters.items()
+            if param.default is inspect.Parameter.empty
+        }
+
+    for param_name in names:
+        if param_name == 'self':
+            continue
+        
+        # Determine type via the memoized dispatch table
+        param_type = "string"
+        annotation = annotations.get(param_name)
+        if annotation is not None:
+            param_type = _schema_type(annotation)
+        
+        # Extract description from docstring if available
+        param_desc = param_descs.get(param_name, "").strip() or f"{param_name} parameter"
+        
+        properties[param_name] = {
+            "type": param_type,
+            "description": param_desc
+        }
+        
+        # Check if required (no default value)
+        if param_name in required_names:
+            required.append(param_name)
+    
+    return {
+        "type": "function",
+        "function": {
+            "name": func.__name__,
+            "description": doc.split('\n')[0] if '\n' in doc else doc,
+            "parameters": {
+                "type": "object",
+                "properties": properties,
+                "required": required
+            }
+        }
+    }
+
 
 class ToolManager:
     """Simplified tool manager for litellm. Now supports both local and MCP tools."""
-    
+
+    # Fixed slots: no per-instance __dict__, attribute reads on the hot
+    # execute path go through C-level descriptors. Subclasses that need
+    # ad-hoc attributes (EnhancedToolManager) still get their own __dict__.
+    __slots__ = (
+        "chat_history",
+        "_get_messages",
+        "tools",
+        "_is_async",
+        "_schemas",
+        "_schemas_tuple",
+        "_schemas_json",
+        "mcp_clients",
+        "_mcp_owned_names",
+    )
+
     def __init__(self, chat_history: Optional["SimpleChatHistory"] = None):
         """Initialize tool manager."""
         self.chat_history = chat_history
+        # Bound once: per-turn message fetches skip the history truthiness
+        # check and attribute chain
+        self._get_messages = (
+            chat_history.get_messages if chat_history is not None else _empty_messages
+        )
         self.tools: Dict[str, Callable] = {}
-        self.tool_schemas: List[Dict[str, Any]] = []
+        # name -> precomputed asyncio.iscoroutinefunction(func); decided
+        # once at registration instead of per execution
+        self._is_async: Dict[str, bool] = {}
+        # Schemas keyed by tool name: re-registering a tool replaces its
+        # schema in O(1) instead of appending a duplicate, and removal
+        # (MCP hot-swap) is a pop. The public tool_schemas list view is
+        # produced by the property below.
+        self._schemas: Dict[str, Dict[str, Any]] = {}
+        # Immutable snapshot handed to callers; safe to iterate while a
+        # concurrent registration mutates the dict
+        self._schemas_tuple: Optional[Tuple[Dict[str, Any], ...]] = None
+        # Serialized form of the schemas, rebuilt lazily after a
+        # registration invalidates it
+        self._schemas_json: Optional[bytes] = None
         self.mcp_clients: Dict[str, Any] = {}  # Store MCP clients by name
+        # Server name -> tool names it contributed, so cleanup can drop them
+        self._mcp_owned_names: Dict[str, set] = {}
     
     def register_tool(self, func: AsyncOrSyncToolFunction) -> None:
         """Register a function as a tool."""
-        name = func.__name__
+        name = sys.intern(func.__name__)
         self.tools[name] = func
-        
-        # Generate OpenAI-format schema
-        schema = self._generate_tool_schema(func)
-        self.tool_schemas.append(schema)
+        self._is_async[name] = asyncio.iscoroutinefunction(func)
+
+        # Generate OpenAI-format schema, reusing a cached one when the same
+        # callable is registered again (e.g. across demos or managers) so the
+        # inspect/typing reflection work is only paid once per function.
+        schema = getattr(func, "_tool_schema", None)
+        if schema is None:
+            schema = self._generate_tool_schema(func)
+            try:
+                func._tool_schema = schema  # type: ignore[attr-defined]
+            except (AttributeError, TypeError):
+                pass  # Builtins and bound methods may reject new attributes
+        self._schemas[name] = schema
+        self._schemas_tuple = None
+        self._schemas_json = None
     
+    def register_tools(self, funcs: List[AsyncOrSyncToolFunction]) -> None:
+        """Register several tools in one batch."""
+        for func in funcs:
+            self.register_tool(func)
+
     def _generate_tool_schema(self, func: Callable) -> Dict[str, Any]:
         """Generate OpenAI-format tool schema from function."""
-        sig = inspect.signature(func)
-        doc = inspect.getdoc(func) or f"Function {func.__name__}"
-        
-        properties = {}
-        required = []
-        
-        for param_name, param in sig.parameters.items():
-            if param_name == 'self':
-                continue
-            
-            # Determine type
-            param_type = "string"
-            if param.annotation != inspect.Parameter.empty:
-                annotation = param.annotation
-                # Handle basic types
-                if annotation == int:
-                    param_type = "integer"
-                elif annotation == float:
-                    param_type = "number"
-                elif annotation == bool:
-                    param_type = "boolean"
-                elif annotation in (list, List):
-                    param_type = "array"
-                elif annotation in (dict, Dict):
-                    param_type = "object"
-                # Handle Optional and generic types
-                elif hasattr(annotation, '__origin__'):
-                    origin = annotation.__origin__
-                    if origin == list or origin is list:
-                        param_type = "array"
-                    elif origin == dict or origin is dict:
-                        param_type = "object"
-                    # Handle Union types (Optional is Union[X, None])
-                    else:
-                        # Try to import Union from typing to check properly
-                        from typing import Union, get_origin, get_args
-                        if get_origin(annotation) is Union:
-                            # Get the first non-None type from Union args
-                            args = get_args(annotation)
-                            for arg in args:
-                                if arg is not type(None):
-                                    if arg == list or get_origin(arg) == list:
-                                        param_type = "array"
-                                        break
-                                    elif arg == dict or get_origin(arg) == dict:
-                                        param_type = "object"
-                                        break
-                                    elif arg == int:
-                                        param_type = "integer"
-                                        break
-                                    elif arg == float:
-                                        param_type = "number"
-                                        break
-                                    elif arg == bool:
-                                        param_type = "boolean"
-                                        break
-                                    elif arg == str:
-                                        param_type = "string"
-                                        break
-            
-            # Extract description from docstring if available
-            param_desc = f"{param_name} parameter"
-            # Simple docstring parsing for parameter descriptions
-            if doc and f":param {param_name}:" in doc:
-                start = doc.find(f":param {param_name}:") + len(f":param {param_name}:")
-                end = doc.find("\n", start)
-                if end != -1:
-                    param_desc = doc[start:end].strip()
-            
-            properties[param_name] = {
-                "type": param_type,
-                "description": param_desc
-            }
-            
-            # Check if required (no default value)
-            if param.default == inspect.Parameter.empty:
-                required.append(param_name)
-        
-        return {
-            "type": "function",
-            "function": {
-                "name": func.__name__,
-                "description": doc.split('\n')[0] if '\n' in doc else doc,
-                "parameters": {
-                    "type": "object",
-                    "properties": properties,
-                    "required": required
-                }
-            }
+        return _generate_tool_schema(func)
+
+    @property
+    def tool_schemas(self) -> List[Dict[str, Any]]:
+        """List view of the registered schemas (kept for compatibility)."""
+        return list(self._schemas.values())
+
+    @tool_schemas.setter
+    def tool_schemas(self, schemas: List[Dict[str, Any]]) -> None:
+        self._schemas = {
+            schema["function"]["name"]: schema for schema in schemas
         }
-    
-    def parse_tools_to_list(self) -> List[Dict[str, Any]]:
-        """Get all tools in OpenAI format for litellm."""
-        return self.tool_schemas if self.tool_schemas else None
+        self._schemas_tuple = None
+        self._schemas_json = None
+
+    def parse_tools_to_list(self) -> Optional[Tuple[Dict[str, Any], ...]]:
+        """Get all tools in OpenAI format for litellm.
+
+        Returns an immutable snapshot: callers can iterate it while a
+        concurrent registration mutates the underlying dict, and nothing
+        downstream needs a defensive copy.
+        """
+        if self._schemas_tuple is None:
+            self._schemas_tuple = tuple(self._schemas.values())
+        return self._schemas_tuple or None
+
+    def parse_tools_to_json(self) -> bytes:
+        """Get all tool schemas pre-serialized as JSON bytes.
+
+        Callers that only need the wire form (logging, HTTP payload
+        assembly) reuse one encoding per registration epoch instead of
+        re-serializing the schema list every turn.
+        """
+        if self._schemas_json is None:
+            self._schemas_json = _json_dumps_bytes(list(self._schemas.values()))
+        return self._schemas_json
     
     async def execute_tool_calls(self, tool_calls: List[ToolCall]) -> List[Any]:
-        """Execute multiple tool calls."""
-        results = []
-        for tool_call in tool_calls:
-            result = await self.execute_tool_call(tool_call)
-            results.append(result)
-        return results
+        """Execute multiple tool calls concurrently.
+
+        Independent calls are fanned out with asyncio.gather so I/O-bound tools
+        overlap instead of running back-to-back. Results are returned in the
+        same order as the input calls.
+        """
+        # Fast path: a single call to a local sync tool runs inline, skipping
+        # task creation and thread offload entirely.
+        if len(tool_calls) == 1:
+            tool_call = tool_calls[0]
+            func = self.tools.get(tool_call.name)
+            if func is not None and not self._tool_is_async(tool_call.name, func):
+                return [self._execute_sync_tool_call(tool_call, func)]
+
+        results = await asyncio.gather(
+            *(self.execute_tool_call(tool_call) for tool_call in tool_calls),
+            return_exceptions=True,
+        )
+        # execute_tool_call already converts its own failures to error strings;
+        # normalize anything that still escaped (e.g. cancellation) the same way.
+        return [
+            _ERR_EXEC(tool_call.name, result)
+            if isinstance(result, BaseException)
+            else result
+            for tool_call, result in zip(tool_calls, results)
+        ]
     
+    @staticmethod
+    def _parse_arguments(tool_call: ToolCall) -> Dict[str, Any]:
+        """Parse a tool call's arguments into a kwargs dict."""
+        if isinstance(tool_call.arguments, (str, bytes)):
+            # isspace scans in C without allocating the stripped copy
+            if not tool_call.arguments or tool_call.arguments.isspace():
+                args = {}
+            else:
+                # orjson takes bytes directly, so SDK payloads that arrive
+                # un-decoded skip the decode step entirely
+                args = _json_loads(tool_call.arguments)
+        else:
+            args = tool_call.arguments
+
+        # Handle empty/None arguments
+        return args or {}
+
+    async def _parse_arguments_async(self, tool_call: ToolCall) -> Dict[str, Any]:
+        """Parse arguments, offloading oversized payloads to the pool."""
+        raw = tool_call.arguments
+        if isinstance(raw, (str, bytes)) and len(raw) > _PARSE_OFFLOAD_BYTES:
+            return await asyncio.get_running_loop().run_in_executor(
+                _SYNC_TOOL_EXECUTOR, self._parse_arguments, tool_call
+            )
+        return self._parse_arguments(tool_call)
+
+    def _tool_is_async(self, name: str, func: Callable) -> bool:
+        """Look up the registration-time async flag, computing it for
+        tools inserted into self.tools without going through register_tool."""
+        is_async = self._is_async.get(name)
+        if is_async is None:
+            is_async = self._is_async[name] = asyncio.iscoroutinefunction(func)
+        return is_async
+
+    def _execute_sync_tool_call(self, tool_call: ToolCall, func: Callable) -> Any:
+        """Execute a sync tool call inline, without asyncio scheduling."""
+        try:
+            return func(**self._parse_arguments(tool_call))
+        except Exception as e:
+            return _ERR_EXEC(tool_call.name, e)
+
     async def execute_tool_call(self, tool_call: ToolCall) -> Any:
         """Execute a single tool call."""
         if tool_call.name not in self.tools:
-            return f"Error: Tool '{tool_call.name}' not found"
-        
+            return _ERR_NOT_FOUND(tool_call.name)
+
         func = self.tools[tool_call.name]
-        
+
         try:
-            # Parse arguments
-            if isinstance(tool_call.arguments, str):
-                if tool_call.arguments.strip() == "":
-                    args = {}
-                else:
-                    args = json.loads(tool_call.arguments)
-            else:
-                args = tool_call.arguments
-            
-            # Handle empty/None arguments
-            if not args:
-                args = {}
-            
-            # Execute function
-            if asyncio.iscoroutinefunction(func):
+            args = await self._parse_arguments_async(tool_call)
+
+            # Execute function; MCP wrappers expose a direct entry point
+            # that takes the parsed dict without a kwargs round-trip
+            mcp_call = getattr(func, "_mcp_call", None)
+            if mcp_call is not None:
+                result = await mcp_call(args)
+            elif self._tool_is_async(tool_call.name, func):
                 result = await func(**args)
             else:
-                result = func(**args)
-            
+                # Run sync tools in the shared worker pool so CPU-bound work
+                # doesn't block the event loop while other calls are in flight.
+                result = await asyncio.get_running_loop().run_in_executor(
+                    _SYNC_TOOL_EXECUTOR, functools.partial(func, **args)
+                )
+
             return result
         except Exception as e:
-            return f"Error executing {tool_call.name}: {str(e)}"
+            return _ERR_EXEC(tool_call.name, e)
     
     def chat_history_to_messages(self) -> List[Dict[str, Any]]:
         """Get messages from chat history for litellm."""
-        if self.chat_history:
-            return self.chat_history.get_messages()
-        return []
+        return self._get_messages()
     
     async def register_mcp_server(self, server_name: str, command: str, args: List[str], 
                                  env: Optional[Dict[str, str]] = None) -> bool:
@@ -203,7 +455,7 @@ class ToolManager:
             success = await client.start(command, args, env)
             
             if not success:
-                logger.error(f"Failed to start MCP server: {server_name}")
+                logger.error("Failed to start MCP server: %s", server_name)
                 return False
             
             # Store client
@@ -212,38 +464,75 @@ class ToolManager:
             # Create adapter
             adapter = MCPToolAdapter(client)
             
-            # Register all tools from the MCP server
+            # Register all tools from the MCP server in one batch: a
+            # single extend/update instead of per-tool appends, and one
+            # aggregated log line instead of one per tool
             tools = client.get_tools()
+            new_schemas = []
+            new_tools = {}
             for mcp_tool in tools:
-                # Convert to OpenAI schema
-                schema = adapter.convert_mcp_tool_to_schema(mcp_tool)
-                self.tool_schemas.append(schema)
-                
-                # Create wrapper function
-                wrapper_func = adapter.create_mcp_tool_function(mcp_tool.name)
-                self.tools[mcp_tool.name] = wrapper_func
-                
-                logger.info(f"Registered MCP tool: {mcp_tool.name}")
-            
-            logger.info(f"Successfully registered MCP server {server_name} with {len(tools)} tools")
+                name = sys.intern(mcp_tool.name)
+                new_schemas.append(adapter.convert_mcp_tool_to_schema(mcp_tool))
+                new_tools[name] = adapter.create_mcp_tool_function(name)
+
+            for schema in new_schemas:
+                self._schemas[schema["function"]["name"]] = schema
+            self.tools.update(new_tools)
+            # MCP wrappers are always coroutines
+            self._is_async.update(dict.fromkeys(new_tools, True))
+            self._mcp_owned_names[server_name] = set(new_tools)
+            self._schemas_tuple = None
+            self._schemas_json = None
+
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "Registered MCP server %s with %d tools: %s",
+                    server_name, len(new_tools), list(new_tools),
+                )
             return True
             
         except Exception as e:
-            logger.error(f"Error registering MCP server {server_name}: {e}")
+            logger.error("Error registering MCP server %s: %s", server_name, e)
             return False
     
+    async def _stop_mcp_server(self, server_name: str, client: Any) -> None:
+        """Stop one MCP server and drop the tools it contributed."""
+        try:
+            await client.stop()
+            logger.info("Stopped MCP server: %s", server_name)
+        except Exception as e:
+            logger.error("Error stopping MCP server %s: %s", server_name, e)
+
+        for name in self._mcp_owned_names.pop(server_name, ()):
+            self.tools.pop(name, None)
+            self._is_async.pop(name, None)
+            self._schemas.pop(name, None)
+        self._schemas_tuple = None
+        self._schemas_json = None
+
     async def cleanup_mcp_servers(self):
-        """Cleanup all MCP servers."""
-        for server_name, client in self.mcp_clients.items():
-            try:
-                await client.stop()
-                logger.info(f"Stopped MCP server: {server_name}")
-            except Exception as e:
-                logger.error(f"Error stopping MCP server {server_name}: {e}")
-        
+        """Cleanup all MCP servers.
+
+        Servers stop concurrently, so shutdown costs the slowest stop
+        rather than the sum, and one stuck server can't serialize the rest.
+        """
+        if self.mcp_clients:
+            await asyncio.gather(
+                *(
+                    self._stop_mcp_server(name, client)
+                    for name, client in self.mcp_clients.items()
+                ),
+                return_exceptions=True,
+            )
+
         self.mcp_clients.clear()
 
     # Backwards compatibility - these can be removed if not needed
     async def register_tool_async(self, func: AsyncOrSyncToolFunction) -> None:
-        """Register tool async - for backwards compatibility."""
+        """Register a tool (deprecated).
+
+        Registration is synchronous; call register_tool directly and skip
+        the coroutine allocation this compatibility shim pays per call.
+        Kept async so existing `await` call sites don't break.
+        """
         self.register_tool(func)
\ No newline at end of file
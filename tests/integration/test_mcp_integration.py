@@ -19,6 +19,7 @@ from llmgine.llm.tools.enhanced_tool_manager import (
 
 from any_mcp.managers.manager import MCPManager
 from any_mcp.core.client import MCPClient
+from any_mcp.integration.tool_adapter import LLMgineToolAdapter
 
 
 class TestEnhancedToolManager:
@@ -141,8 +142,11 @@ class TestEnhancedToolManager:
         with patch('any_mcp.managers.manager.MCPManager') as mock_mcp_manager:
             mock_manager = AsyncMock()
             mock_manager.active_clients = {"test_server": AsyncMock()}
+            mock_manager.server_status = MagicMock(
+                return_value={"test_server": True}
+            )
             mock_mcp_manager.return_value = mock_manager
-            
+
             await manager.initialize_mcp()
             manager._mcp_tools_cache = [
                 {"mcp_name": "test_server", "tool_name": "test_tool"}
@@ -224,6 +228,72 @@ class TestCreateEnhancedToolManager:
                 assert mock_manager.start_mcp.call_count == 2
 
 
+class TestToolAdapterResultCache:
+    """Test opt-in result memoization on the tool adapter."""
+
+    def _make_adapter(self):
+        """Build an adapter over a mock manager whose calls succeed."""
+        mock_manager = MagicMock()
+        call_result = MagicMock()
+        call_result.isError = False
+        call_result.content = [MagicMock(text="42")]
+        mock_manager.call_mcp = AsyncMock(return_value=call_result)
+        return LLMgineToolAdapter(mock_manager), mock_manager
+
+    @pytest.mark.asyncio
+    async def test_unmarked_tool_always_reaches_server(self):
+        """Tools not opted in must hit the server on every call."""
+        adapter, mock_manager = self._make_adapter()
+
+        first = await adapter.execute_tool("calc_add", {"a": 1, "b": 2})
+        second = await adapter.execute_tool("calc_add", {"a": 1, "b": 2})
+
+        assert first["success"] and second["success"]
+        assert mock_manager.call_mcp.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_cacheable_tool_served_from_cache(self):
+        """An opted-in tool's repeat call skips the server round-trip."""
+        adapter, mock_manager = self._make_adapter()
+        adapter.mark_tool_cacheable("add")
+
+        first = await adapter.execute_tool("calc_add", {"a": 1, "b": 2})
+        second = await adapter.execute_tool("calc_add", {"a": 1, "b": 2})
+
+        assert mock_manager.call_mcp.call_count == 1
+        assert second == first
+
+        # Different arguments are a different cache entry
+        await adapter.execute_tool("calc_add", {"a": 3, "b": 4})
+        assert mock_manager.call_mcp.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_opt_out_evicts_cached_results(self):
+        """Opting back out drops cached entries so calls hit the server."""
+        adapter, mock_manager = self._make_adapter()
+        adapter.mark_tool_cacheable("add")
+
+        await adapter.execute_tool("calc_add", {"a": 1, "b": 2})
+        adapter.mark_tool_non_cacheable("add")
+
+        await adapter.execute_tool("calc_add", {"a": 1, "b": 2})
+        await adapter.execute_tool("calc_add", {"a": 1, "b": 2})
+        assert mock_manager.call_mcp.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_failed_calls_are_not_cached(self):
+        """Only successful results are memoized, even for cacheable tools."""
+        adapter, mock_manager = self._make_adapter()
+        adapter.mark_tool_cacheable("add")
+        mock_manager.call_mcp = AsyncMock(side_effect=Exception("boom"))
+
+        first = await adapter.execute_tool("calc_add", {"a": 1, "b": 2})
+        second = await adapter.execute_tool("calc_add", {"a": 1, "b": 2})
+
+        assert not first["success"] and not second["success"]
+        assert mock_manager.call_mcp.call_count == 2
+
+
 class TestMCPManager:
     """Test the MCP manager component."""
     
@@ -236,18 +236,62 @@ class TestToolManager:
         manager = ToolManager()
         manager.register_tool(get_weather)
         manager.register_tool(calculate)
-        
+
         tool_calls = [
             ToolCall(id="1", name="get_weather", arguments='{"city": "Paris"}'),
             ToolCall(id="2", name="calculate", arguments='{"expression": "5 * 5"}'),
             ToolCall(id="3", name="get_weather", arguments='{"city": "Tokyo"}')
         ]
-        
+
         results = await manager.execute_tool_calls(tool_calls)
         assert len(results) == 3
         assert "Paris" in results[0]
         assert results[1] == 25
         assert "Tokyo" in results[2]
+
+    @pytest.mark.asyncio
+    async def test_execute_multiple_tools_preserves_order_on_error(self):
+        """Test that failures come back as error strings in input order."""
+        manager = ToolManager()
+        manager.register_tool(get_weather)
+        manager.register_tool(calculate)
+        manager.register_tool(async_search)
+
+        tool_calls = [
+            ToolCall(id="1", name="calculate", arguments='{"expression": "2 + 2"}'),
+            ToolCall(id="2", name="calculate", arguments='{"expression": "bad"}'),
+            ToolCall(id="3", name="missing_tool", arguments='{}'),
+            ToolCall(id="4", name="async_search", arguments='{"query": "x", "limit": 1}'),
+        ]
+
+        results = await manager.execute_tool_calls(tool_calls)
+        assert len(results) == 4
+        assert results[0] == 4
+        assert "Error executing calculate:" in results[1]
+        assert "Error: Tool 'missing_tool' not found" in results[2]
+        assert isinstance(results[3], list)
+
+    @pytest.mark.asyncio
+    async def test_execute_multiple_tools_normalizes_exceptions(self):
+        """Test that exceptions escaping a call become error strings, not raises."""
+        async def cancelled_tool() -> str:
+            """A tool whose task gets cancelled mid-flight."""
+            raise asyncio.CancelledError()
+
+        manager = ToolManager()
+        manager.register_tool(get_weather)
+        manager.register_tool(cancelled_tool)
+
+        tool_calls = [
+            ToolCall(id="1", name="cancelled_tool", arguments='{}'),
+            ToolCall(id="2", name="get_weather", arguments='{"city": "Oslo"}'),
+        ]
+
+        results = await manager.execute_tool_calls(tool_calls)
+        assert len(results) == 2
+        assert isinstance(results[0], str)
+        assert "Error executing cancelled_tool:" in results[0]
+        assert "Oslo" in results[1]
     
     def test_chat_history_integration(self):
         """Test integration with chat history."""
@@ -317,4 +361,36 @@ class TestToolManager:
         params = tool["function"]["parameters"]
         assert params["type"] == "object"
         assert "properties" in params
-        assert "required" in params
\ No newline at end of file
+        assert "required" in params
+
+    def test_tool_schemas_setter_compatibility(self):
+        """Test that tool_schemas still behaves like a plain list attribute."""
+        manager = ToolManager()
+        manager.register_tool(get_weather)
+        assert [s["function"]["name"] for s in manager.tool_schemas] == ["get_weather"]
+
+        # Cache a snapshot, then replace the schemas wholesale like legacy
+        # callers do
+        old_snapshot = manager.parse_tools_to_list()
+        replacement = [
+            {
+                "type": "function",
+                "function": {
+                    "name": "injected_tool",
+                    "description": "Injected schema",
+                    "parameters": {"type": "object", "properties": {}, "required": []},
+                },
+            }
+        ]
+        manager.tool_schemas = replacement
+
+        assert manager.tool_schemas == replacement
+        # The cached snapshot must be invalidated, not served stale
+        new_snapshot = manager.parse_tools_to_list()
+        assert new_snapshot != old_snapshot
+        assert new_snapshot[0]["function"]["name"] == "injected_tool"
+
+        # Re-registering merges into the replaced set keyed by name
+        manager.register_tool(calculate)
+        names = {s["function"]["name"] for s in manager.tool_schemas}
+        assert names == {"injected_tool", "calculate"}
\ No newline at end of file